@@ -11,8 +11,9 @@ Workflow:
 
 1) Load the requested region geometry (RTO/ISO polygons or U.S. state boundaries) if a region is specified.
    If an individual station is specified, geometry loading is skipped.
-2) Retrieve the ISD-Lite station catalog and either spatially filter stations to the region or select
-   the specified station by USAF and WBAN identifiers (as listed in isd-history.txt).
+2) Retrieve the ISD-Lite station catalog (unless an identical copy is present in the data directory) and
+   either spatially filter stations to the region or select the specified station by USAF and WBAN
+   identifiers (as listed in isd-history.txt).
 3) Filter the resulting stations by data availability over [start_year, end_year].
 4) Save a text file with the resulting station list to the data directory (for both region and single-station modes).
 5) Download ISD-Lite observation files for the filtered station IDs. Files already present in the download
@@ -22,6 +23,7 @@ Workflow:
 6) Load observations and save the full-hourly UTC time series as a NetCDF file.
 
 Inputs are provided via command-line arguments. Outputs include:
+- The ISD station list as downloaded from NCEI, and its parsed content as a Parquet file.
 - A text file listing the stations used.
 - The downloaded ISD-Lite data files (unless offline mode is selected).
 - A NetCDF file containing the full-hourly UTC time series.
@@ -213,8 +215,12 @@ def main(argv=None):
         world_dir_res = files('isd_lite_data') / 'data' / 'WorldBank' / 'WB_countries_Admin0_10m'
         with as_file(world_dir_res) as world_dir_path:
             world_shp_file = world_dir_path / 'WB_countries_Admin0_10m.shp'
-            countries_gdf = gpd.read_file(world_shp_file)
-        region_gdf = countries_gdf[countries_gdf['ISO_A3'].isin([region_code])]
+            # Read only the selected country, with the filter applied while reading the file
+            region_gdf = gpd.read_file(
+                world_shp_file,
+                where=f"ISO_A3 = '{region_code}'",
+                columns=['ISO_A3', 'NAME_EN'],
+            )
         region_name = region_gdf['NAME_EN'].values[0]
 
     elif len(region_code) == 2:
@@ -226,8 +232,10 @@ def main(argv=None):
         us_states_dir_res = files('isd_lite_data') / 'data' / 'CensusBureau' / 'US_states'
         with as_file(us_states_dir_res) as us_states_dir_path:
             us_states_shp_file = us_states_dir_path / 'tl_2024_us_state.shp'
-            us_gdf = gpd.read_file(us_states_shp_file)
-        region_gdf = us_gdf[us_gdf['STUSPS'].isin([region_code])]
+            # Read only the selected state or territory, with the filter applied while reading the file
+            region_gdf = gpd.read_file(
+                us_states_shp_file, where=f"STUSPS = '{region_code}'", columns=['STUSPS']
+            )
         region_name = region_code
 
     elif region_code in region_codes.rto_iso_regions:
@@ -244,9 +252,13 @@ def main(argv=None):
         us_states_dir_res = files('isd_lite_data') / 'data' / 'CensusBureau' / 'US_states'
         with as_file(us_states_dir_res) as us_states_dir_path:
             us_states_shp_file = us_states_dir_path / 'tl_2024_us_state.shp'
-            us_gdf = gpd.read_file(us_states_shp_file)
-        exclude_codes = ['AK', 'HI', 'PR', 'GU', 'VI', 'AS', 'MP']
-        region_gdf = us_gdf[~us_gdf['STUSPS'].isin(exclude_codes)]
+            # Read only the CONUS states, with the filter applied while reading the file
+            exclude_codes = ['AK', 'HI', 'PR', 'GU', 'VI', 'AS', 'MP']
+            region_gdf = gpd.read_file(
+                us_states_shp_file,
+                where='STUSPS NOT IN (' + ', '.join(f"'{code}'" for code in exclude_codes) + ')',
+                columns=['STUSPS'],
+            )
         region_name = region_code
 
     else:
@@ -257,14 +269,25 @@ def main(argv=None):
     # File with list of all stations and metadata
 
     all_stations_file = data_dir / Path(os.path.basename(ncei.isd_lite_stations_url))
+    all_stations_parquet_file = all_stations_file.with_suffix('.parquet')
 
     if offline:
-        # Load the file from disk - it must have been downloaded previously to the data directory
-        all_stations = stations.Stations.from_file(all_stations_file)
+        # Load the file from disk - it must have been downloaded previously to the data directory.
+        # Prefer the Parquet copy, which is much faster to read than the text file, unless it is
+        # older than the text file (e.g. because the text file was replaced).
+        if all_stations_parquet_file.exists() and (
+            not all_stations_file.exists()
+            or all_stations_parquet_file.stat().st_mtime >= all_stations_file.stat().st_mtime
+        ):
+            all_stations = stations.Stations.from_parquet(all_stations_parquet_file)
+        else:
+            all_stations = stations.Stations.from_file(all_stations_file).save_station_list_parquet(
+                'ISD Lite stations', all_stations_parquet_file
+            )
     else:
-        # Load the file from the NCEI server and save it for later use
-        all_stations = stations.Stations.from_url()
-        all_stations.save_station_list('ISD Lite stations', all_stations_file)
+        # Load the file from the NCEI server unless an identical copy has been saved to the data
+        # directory previously. The file and its parsed Parquet copy are kept for later use.
+        all_stations = stations.Stations.from_url(cache_dir=data_dir, verbose=True)
 
     # Determine if we are working on a region or an individual station
 
@@ -281,7 +304,7 @@ def main(argv=None):
         )
     else:
         region_stations = region_stations.filter_by_data_availability_online(
-            start_date, end_date, verbose=True
+            start_date, end_date, verbose=True, n_jobs=n_jobs
         )
 
     # Save the metadata file for these stations
@@ -307,7 +330,9 @@ def main(argv=None):
 
     # Load the full-hourly UTC time series from the ISD-Lite station data
 
-    region_stations.load_observations(data_dir, start_date.year, end_date.year, verbose=True)
+    region_stations.load_observations(
+        data_dir, start_date.year, end_date.year, verbose=True, n_jobs=n_jobs
+    )
 
     region_stations.observations.attrs['region'] = region_name
 
@@ -2,13 +2,36 @@
 Tools for download of ISD Lite data from National Centers for Environmental Information (NCEI), https://www.ncei.noaa.gov.
 """
 
+import os
 import re
+import shutil
 import time
+from collections.abc import Iterator
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from email.utils import formatdate
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+
+__all__ = [
+    "isd_lite_url",
+    "isd_lite_stations_url",
+    "isd_lite_data_url",
+    "isd_lite_data_urls",
+    "isd_lite_data_file_name",
+    "isd_lite_data_file_paths",
+    "download_stations",
+    "download_one",
+    "download_many",
+    "download_threaded",
+    "download_iter",
+    "session",
+    "default_session",
+    "download_file",
+]
 
 # ISD Lite data URL
 isd_lite_url = 'https://www.ncei.noaa.gov/pub/data/noaa/isd-lite'
@@ -16,6 +39,10 @@ isd_lite_url = 'https://www.ncei.noaa.gov/pub/data/noaa/isd-lite'
 # Integrated Surface Database (ISD) Station History (station meta data) file
 isd_lite_stations_url = 'https://www.ncei.noaa.gov/pub/data/noaa/isd-history.txt'
 
+# Simple and robust anchor href extractor (double or single quotes), for HTML directory indices.
+# Matches bytes, so that the indices need not be decoded as a whole.
+_href_re = re.compile(rb"""<a\s+[^>]*href\s*=\s*(['"])(?P<href>[^'"]+)\1""", re.IGNORECASE)
+
 
 def isd_lite_data_url(year: int, usaf_id: str, wban_id: str) -> str:
     """
@@ -30,18 +57,14 @@ def isd_lite_data_url(year: int, usaf_id: str, wban_id: str) -> str:
         str: URL of a NCEI ISD Lite station data file
     """
 
-    url = (
-        isd_lite_url.rstrip('/')
-        + '/'
-        + str(year)
-        + '/'
-        + isd_lite_data_file_name(year, usaf_id, wban_id)
-    )
+    url = f'{isd_lite_url.rstrip("/")}/{year}/{usaf_id}-{wban_id}-{year}.gz'
 
     return url
 
 
-def isd_lite_data_urls(start_year: int, end_year: int, timeout: float = 20.0) -> list[str]:
+def isd_lite_data_urls(
+    start_year: int, end_year: int, timeout: float = 20.0, n_jobs: int = 1
+) -> list[str]:
     """
     Collects all file URLs from the NOAA ISD-Lite directory for the inclusive
     range of years [start_year, end_year].
@@ -54,6 +77,7 @@ def isd_lite_data_urls(start_year: int, end_year: int, timeout: float = 20.0) ->
         start_year (int): First year to include (inclusive).
         end_year   (int): Last year to include (inclusive). Must be >= start_year.
         timeout   (float): Per-request timeout in seconds.
+        n_jobs      (int): Maximum number of year directory indices fetched in parallel.
 
     Returns:
         list[str]: Absolute URLs of files under the specified year directories.
@@ -61,54 +85,89 @@ def isd_lite_data_urls(start_year: int, end_year: int, timeout: float = 20.0) ->
     if end_year < start_year:
         raise ValueError("end_year must be greater than or equal to start_year.")
 
-    headers = {"User-Agent": "Mozilla/5.0"}
+    if n_jobs is None:
+        n_jobs = 1
+
     file_urls: set[str] = set()
 
-    # Simple and robust anchor href extractor (double or single quotes)
-    href_re = re.compile(r"""<a\s+[^>]*href\s*=\s*(['"])(?P<href>[^'"]+)\1""", re.IGNORECASE)
+    # The year directory indices are fetched in parallel threads sharing one session
+
+    with session(pool_size=n_jobs) as http, ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        for year_file_urls in executor.map(
+            lambda year: _year_file_urls(year, timeout, http), range(start_year, end_year + 1)
+        ):
+            file_urls.update(year_file_urls)
+
+    return sorted(file_urls)
+
+
+def _year_file_urls(year: int, timeout: float, http: requests.Session) -> set[str]:
+    """
+    Collects the file URLs from the HTML directory index of one year in the NOAA ISD-Lite directory.
+
+    Args:
+        year (int): Year of the directory.
+        timeout (float): Request timeout in seconds.
+        http (requests.Session): HTTP session used for the request.
+
+    Returns:
+        set[str]: Absolute URLs of files in the year directory. Empty if the directory index
+                  could not be retrieved.
+    """
+
+    headers = {"User-Agent": "Mozilla/5.0"}
+    file_urls: set[str] = set()
 
     isd_lite_url_ = isd_lite_url.rstrip('/')
 
-    for year in range(start_year, end_year + 1):
-        year_dir = f"{isd_lite_url_}/{year}/"
-        print('Collecting file URLs from NCEI server directory', year_dir)
-        try:
-            resp = requests.get(year_dir, allow_redirects=True, timeout=timeout, headers=headers)
-        except requests.RequestException:
-            continue
+    year_dir = f"{isd_lite_url_}/{year}/"
+    print('Collecting file URLs from NCEI server directory', year_dir)
+    try:
+        resp = http.get(year_dir, allow_redirects=True, timeout=timeout, headers=headers)
+    except requests.RequestException:
+        return file_urls
 
-        content_type = resp.headers.get("Content-Type", "")
-        if resp.status_code >= 400 or "text/html" not in content_type:
-            continue
+    content_type = resp.headers.get("Content-Type", "")
+    if resp.status_code >= 400 or "text/html" not in content_type:
+        return file_urls
 
-        # Normalize and constrain to the year directory
-        parsed_year = urlparse(year_dir)
-        year_path_prefix = parsed_year.path
+    # Normalize and constrain to the year directory
+    parsed_year = urlparse(year_dir)
+    year_path_prefix = parsed_year.path
+    year_netloc = parsed_year.netloc
 
-        for m in href_re.finditer(resp.text):
-            href = m.group("href")
+    encoding = resp.encoding or "utf-8"
 
-            # Skip parent or root links
-            if href in ("../", "/"):
-                continue
-            # Skip obvious directories (links ending with '/')
-            if href.endswith("/"):
-                continue
+    for m in _href_re.finditer(resp.content):
+        href = m.group("href").decode(encoding, errors="replace")
 
-            abs_url = urljoin(year_dir, href)
-            p = urlparse(abs_url)
+        # Skip parent or root links
+        if href in ("../", "/"):
+            continue
+        # Skip obvious directories (links ending with '/')
+        if href.endswith("/"):
+            continue
 
-            # Constrain to same host and year directory to avoid traversing upward
-            if p.scheme not in ("http", "https"):
-                continue
-            if p.netloc != parsed_year.netloc:
-                continue
-            if not p.path.startswith(year_path_prefix):
-                continue
+        # Fast path for bare file names, such as all ISD Lite data file names: relative to the
+        # year directory, they need no URL parsing
+        if href not in (".", "..") and not any(c in href for c in "/?#:;"):
+            file_urls.add(year_dir + href)
+            continue
 
-            file_urls.add(p._replace(params="", query="", fragment="").geturl())
+        abs_url = urljoin(year_dir, href)
+        p = urlparse(abs_url)
 
-    return sorted(file_urls)
+        # Constrain to same host and year directory to avoid traversing upward
+        if p.scheme not in ("http", "https"):
+            continue
+        if p.netloc != year_netloc:
+            continue
+        if not p.path.startswith(year_path_prefix):
+            continue
+
+        file_urls.add(p._replace(params="", query="", fragment="").geturl())
+
+    return file_urls
 
 
 def isd_lite_data_file_name(year: int, usaf_id: str, wban_id: str) -> str:
@@ -124,7 +183,7 @@ def isd_lite_data_file_name(year: int, usaf_id: str, wban_id: str) -> str:
         str: Local file name.
     """
 
-    file_name = usaf_id + '-' + wban_id + '-' + str(year) + '.gz'
+    file_name = f'{usaf_id}-{wban_id}-{year}.gz'
 
     return file_name
 
@@ -151,29 +210,26 @@ def isd_lite_data_file_paths(
         list[Path]: List of local paths of the downloaded files.
     """
 
-    # Construct local file paths
-
-    all_local_file_paths = []
-
-    for year in range(start_year, end_year + 1):
-        local_file_paths = []
-
-        for id in ids:
-            usaf_id = id[0]
-            wban_id = id[1]
-            local_file_paths.append(local_dir / isd_lite_data_file_name(year, usaf_id, wban_id))
+    # Construct local file paths, in a single list instead of concatenating a list per year
 
-        all_local_file_paths = all_local_file_paths + local_file_paths
+    all_local_file_paths = [
+        local_dir / isd_lite_data_file_name(year, usaf_id, wban_id)
+        for year in range(start_year, end_year + 1)
+        for usaf_id, wban_id in ids
+    ]
 
     return all_local_file_paths
 
 
-def download_stations(local_file: Path):
+def download_stations(local_file: Path, refresh: bool = False):
     """
     Downloads the Integrated Surface Database (ISD) Station History (station meta data) file
 
     Args:
         local_file (Path): Local file where the downloaded file will be saved.
+        refresh (bool, optional): If True, download even if the file already exists. Defaults to False,
+                                  in which case the file is only downloaded if its local ETag differs
+                                  from its ETag online.
     """
 
     # Create parent directory if needed
@@ -182,7 +238,7 @@ def download_stations(local_file: Path):
 
     # Download file
 
-    download_file(isd_lite_stations_url, local_file, verbose=True)
+    download_file(isd_lite_stations_url, local_file, refresh=refresh, verbose=True)
 
     return
 
@@ -194,6 +250,7 @@ def download_one(
     local_dir: Path,
     refresh: bool = False,
     verbose: bool = False,
+    trust_mtime: bool = False,
 ) -> Path:
     """
     Downloads an ISD Lite data file for a given year and station.
@@ -205,6 +262,10 @@ def download_one(
         local_dir (Path): Local directory where the downloaded files will be saved.
         refresh (bool, optional): If True, download even if the file already exists. Defaults to False.
         verbose (bool): If True, print information. Defaults to False.
+        trust_mtime (bool, optional): If True and refresh is False, a file that exists locally
+                                      without an ETag (e.g. copied from elsewhere) is downloaded
+                                      only if it was modified online after its local modification
+                                      time. Defaults to False.
 
     Returns:
         Path: Local path of the downloaded file.
@@ -220,7 +281,7 @@ def download_one(
 
     # Download file
 
-    download_file(url, local_file_path, refresh=refresh, verbose=verbose)
+    download_file(url, local_file_path, refresh=refresh, verbose=verbose, trust_mtime=trust_mtime)
 
     return local_file_path
 
@@ -233,12 +294,13 @@ def download_many(
     n_jobs: int = 1,
     refresh: bool = False,
     verbose: bool = False,
+    skip_existing: bool = False,
+    trust_mtime: bool = False,
 ) -> list[Path]:
     """
     Downloads ISD Lite data files for a given year range (inclusive) and given station IDs,
     even for files that already exists locally. A given number of parallel threads is used
-    to accelerate download. The routine is parallelized over stations, but not over the
-    year range.
+    to accelerate download. The routine is parallelized over stations and years.
 
     Why an inclusive listing? Because that is the canonical definition of a range of years -
     it is not meant to exclude the last one.
@@ -252,37 +314,80 @@ def download_many(
         local_dir (Path): Local directory where the downloaded files will be saved.
         refresh (bool, optional): If True, download even if the file already exists. Defaults to False.
         verbose (bool): If True, print information. Defaults to False.
+        skip_existing (bool, optional): If True and refresh is False, files that already exist
+                                        locally and are not empty are not requested from the
+                                        server at all, and hence are not checked for updates.
+                                        Defaults to False.
+        trust_mtime (bool, optional): If True and refresh is False, a file that exists locally
+                                      without an ETag (e.g. copied from elsewhere) is downloaded
+                                      only if it was modified online after its local modification
+                                      time. Defaults to False.
 
     Returns:
         list[Path]: List of local paths of the downloaded files.
     """
 
-    # Construct URLs and local file paths
+    # Construct URLs and local file paths for all years and stations up front, building each
+    # file name once and deriving both the URL and the local file path from it
+
+    isd_lite_url_ = isd_lite_url.rstrip('/')
+
+    urls = []
 
     all_local_file_paths = []
 
     for year in range(start_year, end_year + 1):
-        urls = []
+        year_url = f'{isd_lite_url_}/{year}/'
+
+        for usaf_id, wban_id in ids:
+            file_name = isd_lite_data_file_name(year, usaf_id, wban_id)
+
+            urls.append(year_url + file_name)
 
-        local_file_paths = []
+            all_local_file_paths.append(local_dir / file_name)
 
-        for id in ids:
-            usaf_id = id[0]
-            wban_id = id[1]
+    # Download each file only once, even if a station is listed more than once
 
-            urls.append(isd_lite_data_url(year, usaf_id, wban_id))
+    tasks = dict(zip(all_local_file_paths, urls, strict=True))
 
-            local_file_paths.append(local_dir / isd_lite_data_file_name(year, usaf_id, wban_id))
+    # Leave out files that are already present, with a single scan of the local directory
+    # instead of one request to the server per file
 
-        download_threaded(urls, local_file_paths, n_jobs=n_jobs, refresh=refresh, verbose=verbose)
+    if skip_existing and not refresh and os.path.isdir(local_dir):
+        with os.scandir(local_dir) as entries:
+            present = {
+                entry.name for entry in entries if entry.is_file() and entry.stat().st_size > 0
+            }
 
-        all_local_file_paths = all_local_file_paths + local_file_paths
+        tasks = {path: url for path, url in tasks.items() if path.name not in present}
+
+        if verbose:
+            print(
+                'Skipping',
+                len(dict.fromkeys(all_local_file_paths)) - len(tasks),
+                'files already present in',
+                local_dir,
+            )
+
+    download_threaded(
+        list(tasks.values()),
+        list(tasks.keys()),
+        n_jobs=n_jobs,
+        refresh=refresh,
+        verbose=verbose,
+        trust_mtime=trust_mtime,
+    )
 
     return all_local_file_paths
 
 
 def download_threaded(
-    urls: list[str], paths: list[Path], n_jobs=1, refresh: bool = False, verbose: bool = False
+    urls: list[str],
+    paths: list[Path],
+    n_jobs=1,
+    refresh: bool = False,
+    verbose: bool = False,
+    trust_mtime: bool = False,
 ):
     """
     Downloads a given number of files from given URLs to given local paths, in parallel.
@@ -293,27 +398,148 @@ def download_threaded(
         n_jobs (int): Maximum number of parallel downloads
         refresh (bool, optional): If True, download even if the file already exists. Defaults to False.
         verbose (bool): If True, print information. Defaults to False.
+        trust_mtime (bool, optional): If True and refresh is False, a file that exists locally
+                                      without an ETag (e.g. copied from elsewhere) is downloaded
+                                      only if it was modified online after its local modification
+                                      time. Defaults to False.
+    """
+
+    for _ in download_iter(
+        urls, paths, n_jobs=n_jobs, refresh=refresh, verbose=verbose, trust_mtime=trust_mtime
+    ):
+        pass
+
+
+def download_iter(
+    urls: list[str],
+    paths: list[Path],
+    n_jobs=1,
+    refresh: bool = False,
+    verbose: bool = False,
+    trust_mtime: bool = False,
+) -> Iterator[Path]:
+    """
+    Downloads a given number of files from given URLs to given local paths, in parallel,
+    and yields the local path of each file as soon as it is available, in order of completion.
+
+    The caller can thus process each file (e.g. decompress and parse it) while the remaining
+    files are still being downloaded. Files that fail to download are reported and not yielded.
+    If the caller stops iterating, downloads that have not started yet are cancelled.
+
+    Args:
+        urls (list[str]): List of URLs of files to download
+        paths (list[Path]): List of local paths of downloaded files
+        n_jobs (int): Maximum number of parallel downloads
+        refresh (bool, optional): If True, download even if the file already exists. Defaults to False.
+        verbose (bool): If True, print information. Defaults to False.
+        trust_mtime (bool, optional): If True and refresh is False, a file that exists locally
+                                      without an ETag (e.g. copied from elsewhere) is downloaded
+                                      only if it was modified online after its local modification
+                                      time. Defaults to False.
+
+    Returns:
+        Iterator[Path]: Local paths of downloaded (or unchanged) files.
     """
 
     if n_jobs is None:
         n_jobs = 1
 
+    # Validate the arguments here rather than in the generator, so that invalid arguments
+    # raise at the call and not only once iteration starts
+
     if len(urls) != len(paths):
         raise ValueError("The number of URLs must match the number of local paths.")
 
-    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
-        futures = [
-            executor.submit(download_file, url, path, refresh, verbose)
+    return _download_iter(urls, paths, n_jobs, refresh, verbose, trust_mtime)
+
+
+def _download_iter(
+    urls: list[str],
+    paths: list[Path],
+    n_jobs: int,
+    refresh: bool,
+    verbose: bool,
+    trust_mtime: bool,
+) -> Iterator[Path]:
+    """
+    Internal generator for download_iter, downloads the files in parallel and yields the local
+    path of each file as soon as it is available.
+
+    Args:
+        urls (list[str]): List of URLs of files to download
+        paths (list[Path]): List of local paths of downloaded files
+        n_jobs (int): Maximum number of parallel downloads
+        refresh (bool): If True, download even if the file already exists.
+        verbose (bool): If True, print information.
+        trust_mtime (bool): If True and refresh is False, a file that exists locally without
+                            an ETag is downloaded only if it was modified online after its
+                            local modification time.
+
+    Yields:
+        Path: Local path of a downloaded (or unchanged) file.
+    """
+
+    # All threads share one session, so that connections are kept alive and reused
+    # instead of performing a new TCP/TLS handshake for every request
+
+    with session(pool_size=n_jobs) as http, ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        futures = {
+            executor.submit(download_file, url, path, refresh, verbose, http, trust_mtime): path
             for url, path in zip(urls, paths, strict=False)
-        ]
-        for future in as_completed(futures):
-            try:
-                future.result()
-            except Exception as exc:
-                print(f"Download generated an exception: {exc}")
+        }
+        try:
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as exc:
+                    print(f"Download generated an exception: {exc}")
+                else:
+                    yield futures[future]
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def session(pool_size: int = 1) -> requests.Session:
+    '''
+    Creates an HTTP session that keeps connections to the NCEI server alive for reuse.
+
+    The number of connections per host is capped at the pool size: threads sharing the session
+    wait for a free connection instead of opening additional ones, so that the NCEI server
+    never sees more concurrent connections from the session than the pool size.
+
+    Args:
+        pool_size (int): Maximum number of connections per host, which are kept alive. Should be
+                         at least the number of threads sharing the session.
+
+    Returns:
+        requests.Session: HTTP session.
+    '''
+
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, pool_block=True)
+
+    http = requests.Session()
+    http.mount('https://', adapter)
+    http.mount('http://', adapter)
+
+    return http
+
+
+# Session used for requests that are not given a session, so that consecutive downloads of
+# single files reuse the connections to the NCEI server
+
+default_session = session(pool_size=32)
 
 
-def download_file(url: str, local_file_path: Path, refresh: bool = False, verbose: bool = False):
+def download_file(
+    url: str,
+    local_file_path: Path,
+    refresh: bool = False,
+    verbose: bool = False,
+    http: requests.Session = None,
+    trust_mtime: bool = False,
+    max_retries: int = 1200,
+):
     '''
     Downloads a file from a given URL to a given local path.
 
@@ -324,82 +550,170 @@ def download_file(url: str, local_file_path: Path, refresh: bool = False, verbos
                                   When False:
                                   - if the local ETag of the file matches its ETag online, then the file will not be downloaded.
                                   - if the local ETag of the file differs from its ETag online, then the file will be downloaded.
+                                  - for files served without an ETag, the same applies to their modification time online (Last-Modified).
         verbose (bool): If True, print information. Defaults to False.
+        http (requests.Session, optional): HTTP session used for the requests. If None,
+                                           default_session is used.
+        trust_mtime (bool, optional): If True and refresh is False, a file that exists locally
+                                      without an ETag (e.g. copied from elsewhere) is downloaded
+                                      only if it was modified online after its local modification
+                                      time. Defaults to False.
+        max_retries (int, optional): Maximum number of download attempts, 3 seconds apart unless
+                                     the server asks to back off. Defaults to 1200.
     '''
 
-    max_retries = 1200
+    if http is None:
+        http = default_session
+
     delay_seconds = 3
 
-    # Get ETag with retry
-    for attempt in range(max_retries):
-        try:
-            response = requests.head(url, timeout=10)
-            response.raise_for_status()
-            break
-        except requests.exceptions.RequestException as e:
-            if attempt < max_retries - 1:
-                if verbose:
-                    print(f'HEAD request failed ({e}), retrying in {delay_seconds} second(s)...')
-                time.sleep(delay_seconds)
-            else:
-                raise
+    # Separate timeouts for establishing the connection and for reading the response, so that
+    # an unreachable server is retried after a few seconds instead of after the full read timeout
+
+    timeout_seconds = (10, 30)
 
-    etag = response.headers.get('ETag')
-    if etag is None:
-        message = (
-            '\n'
-            + 'ETag not found of file at URL '
-            + url
-            + '\n'
-            + 'This could mean the file does not exist at this URL.'
-        )
-        raise Exception(message)
+    # When the server signals that it is overloaded (429 Too Many Requests or 503 Service
+    # Unavailable), back off exponentially up to a maximum delay, unless the server says when
+    # to retry, so that parallel downloads do not keep hammering it
+
+    throttle_status_codes = (429, 503)
+    max_delay_seconds = 120
+    n_throttled = 0
 
     etag_file_path = local_file_path.with_name(local_file_path.name + '.etag')
+    last_modified_file_path = local_file_path.with_name(local_file_path.name + '.last-modified')
+
+    # If the file is available locally with its ETag, make the download conditional on the
+    # ETag online differing from the local ETag. The server then responds with 304 (Not Modified)
+    # and without transferring the file if the file has not changed, which saves a separate
+    # request for the ETag online. For files served without an ETag, the modification time
+    # online (Last-Modified) is used in the same way.
+
+    headers = {}
 
-    if not refresh and local_file_path.exists() and etag_file_path.exists():
-        with open(etag_file_path) as f:
-            local_etag = f.read().strip()
-        if local_etag == etag:
-            if verbose:
-                print(
-                    url,
-                    'available locally as',
-                    str(local_file_path),
-                    'and ETag matches ETag online. Skipping download.',
-                )
-            return
-        else:
-            if verbose:
-                print(
-                    url,
-                    'available locally as',
-                    str(local_file_path),
-                    'and ETag differs from ETag online. Proceeding to download.',
-                )
+    if not refresh and local_file_path.exists():
+        if etag_file_path.exists():
+            with open(etag_file_path) as f:
+                headers['If-None-Match'] = f.read().strip()
+        elif last_modified_file_path.exists():
+            with open(last_modified_file_path) as f:
+                headers['If-Modified-Since'] = f.read().strip()
+        elif trust_mtime:
+            # Without a local ETag, make the download conditional on the file online having
+            # been modified after the local file
+
+            headers['If-Modified-Since'] = formatdate(local_file_path.stat().st_mtime, usegmt=True)
 
     # Download with retry
     for attempt in range(max_retries):
         try:
-            with requests.get(url, stream=True, timeout=30) as r:
+            with http.get(url, stream=True, timeout=timeout_seconds, headers=headers) as r:
+                if r.status_code == 304:
+                    if verbose:
+                        print(
+                            url,
+                            'available locally as',
+                            str(local_file_path),
+                            'and unchanged online. Skipping download.',
+                        )
+
+                    # Keep the ETag online for later downloads, if the local ETag is missing
+
+                    etag = r.headers.get('ETag')
+                    if etag is not None and 'If-None-Match' not in headers:
+                        _write_text_atomic(etag_file_path, etag)
+                        last_modified_file_path.unlink(missing_ok=True)
+
+                    return
+
                 r.raise_for_status()
-                with open(local_file_path, 'wb') as f:
-                    for chunk in r.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
+
+                etag = r.headers.get('ETag')
+                last_modified = r.headers.get('Last-Modified')
+
+                if verbose and headers:
+                    print(
+                        url,
+                        'available locally as',
+                        str(local_file_path),
+                        'and changed online. Proceeding to download.',
+                    )
+
+                # Copy in blocks of 256 KiB, which takes a few reads and writes for a typical
+                # ISD Lite data file, instead of the default blocks of 64 KiB.
+                #
+                # The file is written under a temporary name and renamed when complete, so that
+                # an interrupted download never leaves a truncated file under the final name.
+
+                part_file_path = local_file_path.with_name(local_file_path.name + '.part')
+
+                # The complete file is flushed to disk once before the rename, so that the rename
+                # never takes effect ahead of the data. The ETag and modification time kept
+                # from an earlier download are removed first, so that a crash before they are
+                # written again leads to a download instead of a match with the previous file.
+
+                r.raw.decode_content = True
+                try:
+                    with open(part_file_path, 'wb') as f:
+                        shutil.copyfileobj(r.raw, f, length=256 * 1024)
+                        f.flush()
+                        os.fsync(f.fileno())
+                    etag_file_path.unlink(missing_ok=True)
+                    last_modified_file_path.unlink(missing_ok=True)
+                    os.replace(part_file_path, local_file_path)
+                except BaseException:
+                    part_file_path.unlink(missing_ok=True)
+                    raise
             break
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
+            # Reading the response body from r.raw raises urllib3 exceptions, e.g. when the
+            # connection is dropped mid-body or a read times out, which requests does not wrap
+
             if attempt < max_retries - 1:
+                retry_delay_seconds = delay_seconds
+                response = getattr(e, 'response', None)
+                if response is not None and response.status_code in throttle_status_codes:
+                    retry_after = response.headers.get('Retry-After', '')
+                    if retry_after.isdigit():
+                        retry_delay_seconds = min(int(retry_after), max_delay_seconds)
+                    else:
+                        retry_delay_seconds = min(delay_seconds * 2**n_throttled, max_delay_seconds)
+                    n_throttled += 1
                 if verbose:
-                    print(f'Download failed ({e}), retrying in {delay_seconds} second(s)...')
-                time.sleep(delay_seconds)
+                    print(f'Download failed ({e}), retrying in {retry_delay_seconds} second(s)...')
+                time.sleep(retry_delay_seconds)
             else:
                 raise
 
     if verbose:
         print('Downloaded', url, 'as', local_file_path)
 
-    with open(etag_file_path, 'w') as f:
-        f.write(etag)
+    # Keep the ETag, or else the modification time online, for conditional downloads later on.
+    # Without either, the file is downloaded again the next time.
+
+    if etag is not None:
+        _write_text_atomic(etag_file_path, etag)
+    elif last_modified is not None:
+        _write_text_atomic(last_modified_file_path, last_modified)
 
     return
+
+
+def _write_text_atomic(file_path: Path, text: str):
+    '''
+    Writes text to a file under a temporary name and renames it when complete, so that
+    the file is never left partially written.
+
+        Args:
+        file_path (Path): Path of the file
+        text (str): Text to write
+    '''
+
+    tmp_file_path = file_path.with_name(file_path.name + '.part')
+    try:
+        with open(tmp_file_path, 'w') as f:
+            f.write(text)
+        os.replace(tmp_file_path, file_path)
+    except BaseException:
+        tmp_file_path.unlink(missing_ok=True)
+        raise
@@ -26,52 +26,29 @@ def regions(rto_iso_geojson: Path) -> gpd.GeoDataFrame:
 
     regions_raw_gdf = gpd.read_file(rto_iso_geojson)
 
+    return _regions_gdf(regions_raw_gdf, REGION_NAMES)
+
+
+def _regions_gdf(regions_raw_gdf: gpd.GeoDataFrame, names: list[str]) -> gpd.GeoDataFrame:
+    '''
+    Args:
+        regions_raw_gdf : a Geopandas GeoDataFrame holding the features of the RTO/ISO GeoJSON file
+        names : a list with the names of the RTO/ISO regions to construct
+
+    Returns:
+        gdf : a Geopandas GeoDataFrame holding the names and geometries of the given RTO/ISO regions.
+    '''
+
     # Identify RTO/ISO regions
 
-    names = []
     regions = []
 
-    name = 'CAISO'
-    names.append(name)
-    mask = (regions_raw_gdf['RTO_ISO'] == name) & (regions_raw_gdf['LOC_TYPE'] == 'REG')
-    region = regions_raw_gdf.loc[mask, 'geometry'].union_all()
-    regions.append(region)
-
-    name = 'ERCOT'
-    names.append(name)
-    mask = (regions_raw_gdf['RTO_ISO'] == name) & (regions_raw_gdf['LOC_TYPE'] == 'REG')
-    region = regions_raw_gdf.loc[mask, 'geometry'].union_all()
-    regions.append(region)
-
-    name = 'ISONE'
-    names.append(name)
-    mask = (regions_raw_gdf['RTO_ISO'] == name) & (regions_raw_gdf['LOC_TYPE'] == 'REG')
-    region = regions_raw_gdf.loc[mask, 'geometry'].union_all()
-    regions.append(region)
-
-    name = 'NYISO'
-    names.append(name)
-    mask = (regions_raw_gdf['RTO_ISO'] == name) & (regions_raw_gdf['LOC_TYPE'] == 'REG')
-    region = regions_raw_gdf.loc[mask, 'geometry'].union_all()
-    regions.append(region)
-
-    name = 'MISO'
-    names.append(name)
-    mask = (regions_raw_gdf['RTO_ISO'] == name) & (regions_raw_gdf['LOC_TYPE'] == 'REG')
-    region = regions_raw_gdf.loc[mask, 'geometry'].union_all()
-    regions.append(region)
-
-    name = 'PJM'
-    names.append(name)
-    mask = regions_raw_gdf['RTO_ISO'] == name
-    region = regions_raw_gdf.loc[mask, 'geometry'].union_all()
-    regions.append(region)
-
-    name = 'SPP'
-    names.append(name)
-    mask = (regions_raw_gdf['RTO_ISO'] == name) & (regions_raw_gdf['LOC_TYPE'] == 'REG')
-    region = regions_raw_gdf.loc[mask, 'geometry'].union_all()
-    regions.append(region)
+    for name in names:
+        mask = regions_raw_gdf['RTO_ISO'] == name
+        if name != 'PJM':
+            mask = mask & (regions_raw_gdf['LOC_TYPE'] == 'REG')
+        region = regions_raw_gdf.loc[mask, 'geometry'].union_all()
+        regions.append(region)
 
     # Create Geopandas dataframe
 
@@ -100,10 +77,11 @@ def region(rto_iso_geojson: Path, region_name: str) -> gpd.GeoDataFrame:
         'Region name must be one of ' + ', '.join(REGION_NAMES) + '.'
     )
 
-    regions_gdf = regions(rto_iso_geojson)
+    # Read only the features of the selected region, with the filter applied while reading
+    # the file, and combine only their geometries
 
-    mask = regions_gdf['name'] == region_name
+    regions_raw_gdf = gpd.read_file(rto_iso_geojson, where=f"RTO_ISO = '{region_name}'")
 
-    region_gdf = regions_gdf[mask]
+    region_gdf = _regions_gdf(regions_raw_gdf, [region_name])
 
     return region_gdf
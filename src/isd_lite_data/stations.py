@@ -1,19 +1,76 @@
-import gzip
-from datetime import datetime
-from io import StringIO
+import hashlib
+import io
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import cached_property
 from pathlib import Path
 from typing import Self
 
 import geopandas as gpd
 import matplotlib
+import netCDF4
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import requests
+import shapely
+import urllib3
 import xarray as xr
-from shapely.geometry import Point
 
 from isd_lite_data import ncei
 
+# Use the faster ISA-L gzip implementation for decompressing ISD Lite data files if it is
+# installed, and the standard library implementation otherwise
+
+try:
+    from isal import igzip as gzip
+except ImportError:
+    import gzip
+
+# Use rapidgzip, if it is installed, to decompress large ISD Lite data files with several
+# threads. Below the size threshold, starting its thread pool costs more than it saves.
+
+try:
+    import rapidgzip
+except ImportError:
+    rapidgzip = None
+
+rapidgzip_min_file_size = 4 * 1024**2
+
+# Default directory in which station lists downloaded from the NCEI server and parsed station
+# lists are cached, following the XDG base directory convention
+
+default_cache_dir = (
+    Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'isd_lite_data'
+)
+
+
+def _open_gz_text(file_path: Path, n_threads: int = None) -> io.TextIOBase:
+    """
+    Opens a gzipped text file for reading, decompressing it in parallel with rapidgzip if it
+    is installed and the file is large, and with gzip otherwise.
+
+    Args:
+        file_path (Path): Path to the gzipped file.
+        n_threads (int, optional): Number of threads used by rapidgzip. Defaults to the number
+                                   of CPUs.
+
+    Returns:
+        io.TextIOBase: Text stream of the decompressed file content.
+    """
+
+    if rapidgzip is not None and os.path.getsize(file_path) >= rapidgzip_min_file_size:
+        if n_threads is None:
+            n_threads = os.cpu_count() or 1
+
+        return io.TextIOWrapper(rapidgzip.open(str(file_path), parallelization=n_threads))
+
+    return gzip.open(file_path, 'rt')
+
+
 matplotlib.use("Agg")  # Important to avoid runaway memory use upon creating plots repeatedly.
 
 
@@ -93,7 +150,14 @@ class Stations:
 
     var_units = ['C', 'C', 'hPa', 'angular degrees', 'm s-1', '', 'mm', 'mm']
 
-    def __init__(self, meta_data: pd.DataFrame, observations: xr.Dataset = None):
+    # Factors by which the integers in the ISD Lite data files are scaled to obtain the
+    # observations in the above units
+
+    var_scale_factors = [0.1, 0.1, 0.1, 1, 0.1, 1, 0.1, 0.1]
+
+    def __init__(
+        self, meta_data: pd.DataFrame, observations: xr.Dataset = None, _copy: bool = True
+    ):
         """
 
         Default constructor.
@@ -102,40 +166,261 @@ class Stations:
             meta_data (pd.DataFrame): A Pandas dataframe with station metadata
             observations (xr.Dataset, optional): An xarray.Dataset with observations from
                                                  stations given in the station metadata
+            _copy (bool, optional): Internal. If False, meta_data and observations are used as
+                                    is instead of being copied, for callers that have just created
+                                    them and do not keep a reference to them. Defaults to True.
 
         """
 
-        self.meta_data = meta_data.copy(deep=True)
+        self.meta_data = meta_data.copy(deep=True) if _copy else meta_data
+
+        # Station coordinates as contiguous NumPy arrays, for vectorized filtering
+
+        self._lat = self.meta_data['LAT'].to_numpy(dtype=np.float64)
+        self._lon = self.meta_data['LON'].to_numpy(dtype=np.float64)
 
         if observations is not None:
-            self.observations = observations.copy(deep=True)
+            self.observations = observations.copy(deep=True) if _copy else observations
         else:
             self.observations = None
 
         return
 
+    @cached_property
+    def _sindex(self) -> shapely.STRtree:
+        """
+        Spatial index (R-tree) of the station coordinates. Built on first use and reused by
+        subsequent spatial queries on this instance.
+        """
+
+        return shapely.STRtree(shapely.points(self._lon, self._lat))
+
+    @cached_property
+    def _country_rows(self) -> dict[str, np.ndarray]:
+        """
+        Row positions of the stations in each country, keyed by country code. Built on first
+        use and reused by subsequent country filters on this instance.
+        """
+
+        return self.meta_data.groupby('CTRY', observed=True, sort=False).indices
+
+    @cached_property
+    def _us_state_rows(self) -> dict[str, np.ndarray]:
+        """
+        Row positions of the stations in each US state, keyed by US state code. Built on first
+        use and reused by subsequent US state filters on this instance.
+        """
+
+        return self.meta_data.groupby('ST', observed=True, sort=False).indices
+
+    @cached_property
+    def _period_order(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Period of record start and end dates in ascending order, each paired with the row
+        positions of the corresponding stations. Stations without a start or end date are left
+        out. Built on first use and reused by subsequent period filters on this instance.
+        """
+
+        period_order = []
+
+        for column in ['BEGIN', 'END']:
+            dates = self.meta_data[column].to_numpy(dtype='datetime64[us]')
+            rows = np.flatnonzero(~np.isnat(dates))
+            rows = rows[np.argsort(dates[rows], kind='stable')]
+            period_order += [dates[rows], rows]
+
+        return tuple(period_order)
+
+    def _rows_with_codes(self, rows_by_code: dict[str, np.ndarray], codes: list[str]) -> np.ndarray:
+        """
+        Internal helper returning the row positions, in ascending order, of the stations listed
+        under any of the given codes in rows_by_code.
+        """
+
+        rows = [rows_by_code[code] for code in dict.fromkeys(codes) if code in rows_by_code]
+
+        return np.sort(np.concatenate(rows)) if rows else np.empty(0, dtype=np.intp)
+
+    def _rows_in_box(
+        self, min_lat: float, max_lat: float, min_lon: float, max_lon: float
+    ) -> np.ndarray:
+        """
+        Internal helper returning the row positions, in ascending order, of the stations within
+        the inclusive latitude/longitude bounds.
+        """
+
+        # A single pass of vectorized comparisons over the contiguous coordinate arrays is
+        # faster than querying the spatial index for a box, and needs no index to be built
+
+        mask = (self._lat >= min_lat) & (self._lat <= max_lat)
+        mask &= self._lon >= min_lon
+        mask &= self._lon <= max_lon
+
+        return np.flatnonzero(mask)
+
+    def _rows_in_period(self, start_time: datetime, end_time: datetime) -> np.ndarray:
+        """
+        Internal helper returning the row positions, in ascending order, of the stations whose
+        period of record overlaps with the period given by the start and end time.
+        """
+
+        begin, begin_rows, end, end_rows = self._period_order
+
+        start_time = np.datetime64(pd.Timestamp(start_time).to_datetime64(), 'us')
+        end_time = np.datetime64(pd.Timestamp(end_time).to_datetime64(), 'us')
+
+        # Stations whose period of record begins before the end time, and stations whose
+        # period of record ends after the start time
+
+        begin_rows = begin_rows[: np.searchsorted(begin, end_time, side='right')]
+        end_rows = end_rows[np.searchsorted(end, start_time, side='left') :]
+
+        return np.intersect1d(begin_rows, end_rows, assume_unique=True)
+
+    def _select_rows(self, rows: np.ndarray) -> Self:
+        """
+        Internal helper returning a new instance holding the stations at the given row positions.
+        """
+
+        meta_data = self.meta_data.iloc[rows]
+
+        # Reset row index
+
+        meta_data = meta_data.reset_index(drop=True)
+
+        return Stations(meta_data, _copy=False)
+
     @classmethod
-    def from_url(cls) -> Self:
+    def from_url(
+        cls,
+        cache_dir: Path = default_cache_dir,
+        max_age: timedelta = timedelta(days=1),
+        verbose: bool = False,
+    ) -> Self:
         """
 
         Alternative constructor, initializes the ISD station metadata from the
         Integrated Surface Database (ISD) Station History file, available online.
 
-        Args:
+        If a cache directory is given, the Station History file is kept there and is only
+        downloaded again when it has changed on the NCEI server (ETag comparison). The parsed
+        station metadata are kept next to it as a Parquet file, which is read instead of
+        parsing the Station History file again for as long as the latter is unchanged. If the
+        NCEI server cannot be reached, a cached Station History file is used as is.
 
+        Args:
+            cache_dir (Path, optional): Directory in which the Station History file and the parsed
+                                        station metadata are cached. If None, nothing is cached and
+                                        the file is downloaded and parsed on every call. Defaults to
+                                        default_cache_dir (~/.cache/isd_lite_data, or
+                                        $XDG_CACHE_HOME/isd_lite_data if set), which is not
+                                        used if it cannot be written.
+            max_age (timedelta, optional): Cached files younger than max_age are used without
+                                           contacting the NCEI server. If None, the NCEI server is
+                                           always contacted. Defaults to 1 day. Ignored if
+                                           cache_dir is None.
+            verbose (bool, optional): If True, print information, e.g. when the cached Station
+                                      History file is used because the NCEI server cannot be
+                                      reached. Defaults to False.
 
         Returns:
             Stations: An instance of Stations initialized with data obtained online.
 
         """
 
-        response = requests.get(ncei.isd_lite_stations_url)
+        # The cache is used by default, so a default cache directory that cannot be written
+        # (e.g. in a read-only home directory) falls back to no caching instead of failing
+
+        if cache_dir is not None and cache_dir == default_cache_dir:
+            try:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                writable = os.access(cache_dir, os.W_OK)
+            except OSError:
+                writable = False
+
+            if not writable:
+                if verbose:
+                    print('Warning: cannot write to', cache_dir, '- the station list is not cached')
+                cache_dir = None
+
+        if cache_dir is not None:
+            return cls._from_url_cached(cache_dir, max_age, verbose)
+
+        response = ncei.default_session.get(ncei.isd_lite_stations_url)
         response.raise_for_status()
-        text_stream = StringIO(response.text)
+        text_stream = io.StringIO(response.text)
 
         meta_data = cls._read_fwf(text_stream)
 
-        return cls(meta_data)
+        return cls(meta_data, _copy=False)
+
+    @classmethod
+    def _from_url_cached(cls, cache_dir: Path, max_age: timedelta, verbose: bool = False) -> Self:
+        """
+        Internal helper for from_url, initializes the ISD station metadata from a cached copy of
+        the Integrated Surface Database (ISD) Station History file, which is downloaded only if
+        missing or changed on the NCEI server, and from a cached Parquet copy of its parsed content.
+
+        Args:
+            cache_dir (Path): Directory in which the Station History file and the parsed
+                              station metadata are cached. Created if it does not exist.
+            max_age (timedelta): Cached files checked against the NCEI server less than max_age
+                                 ago are used without contacting the NCEI server. If None, the
+                                 NCEI server is always contacted.
+            verbose (bool, optional): If True, print information. Defaults to False.
+
+        Returns:
+            Stations: An instance of Stations initialized with data obtained online or from the cache.
+        """
+
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+        stations_file = cache_dir / Path(os.path.basename(ncei.isd_lite_stations_url))
+        parquet_file = stations_file.with_suffix('.parquet')
+
+        # The time of the last successful check against the NCEI server is kept as the
+        # modification time of a separate file, since an unchanged Station History file is
+        # not written again
+
+        checked_file = stations_file.with_name(stations_file.name + '.checked')
+
+        # Download the Station History file unless the cached copy was checked recently enough.
+        # download_file skips the download if the ETag of the cached copy matches the ETag online.
+
+        recent = (
+            max_age is not None
+            and stations_file.exists()
+            and checked_file.exists()
+            and datetime.now() - datetime.fromtimestamp(checked_file.stat().st_mtime) < max_age
+        )
+
+        if not recent:
+            # Only a few attempts are made, so that a cached copy is used without a long wait
+            # if the NCEI server cannot be reached
+
+            try:
+                ncei.download_file(ncei.isd_lite_stations_url, stations_file, max_retries=3)
+            except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
+                if not stations_file.exists():
+                    raise
+                if verbose:
+                    print(
+                        'Warning: could not check',
+                        ncei.isd_lite_stations_url,
+                        f'({e}), using the cached copy',
+                        stations_file,
+                    )
+            else:
+                checked_file.touch()
+
+        # Use the parsed station metadata if they are not older than the Station History file
+
+        if parquet_file.exists() and parquet_file.stat().st_mtime >= stations_file.stat().st_mtime:
+            return cls.from_parquet(parquet_file)
+
+        return cls.from_file(stations_file).save_station_list_parquet(
+            'ISD Lite stations', parquet_file
+        )
 
     @classmethod
     def from_file(cls, file_path: Path) -> Self:
@@ -158,10 +443,94 @@ class Stations:
 
         meta_data = cls._read_fwf(file_path)
 
-        return cls(meta_data)
+        return cls(meta_data, _copy=False)
+
+    @classmethod
+    def from_cache_or_file(cls, file_path: Path, cache_dir: Path = None) -> Self:
+        """
+
+        Alternative constructor, initializes the ISD station metadata from a file like from_file,
+        and keeps the parsed station metadata as a Parquet file in a cache directory. As long as
+        the file is unchanged (same size and modification time), later calls read the Parquet
+        file instead of parsing the file again.
+
+        Args:
+            file_path (Path): Path to file with station metadata
+            cache_dir (Path, optional): Directory in which the parsed station metadata are cached.
+                                        Created if it does not exist. Defaults to
+                                        default_cache_dir (~/.cache/isd_lite_data, or
+                                        $XDG_CACHE_HOME/isd_lite_data if set).
+
+        Returns:
+            Stations: An instance of Stations initialized with data from the file or the cache.
+
+        """
+
+        if not file_path.exists():
+            raise FileNotFoundError(f"The file {file_path} does not exist.")
+
+        if cache_dir is None:
+            cache_dir = default_cache_dir
+
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Name the cached file after the path of the file, so that there is one cached file per
+        # file, and keep the size and modification time of the file in its metadata, so that a
+        # changed file is parsed again and its cached file replaced
+
+        path_hash = hashlib.sha256(str(file_path.resolve()).encode()).hexdigest()[:16]
+
+        parquet_file = cache_dir / f'{file_path.stem}-{path_hash}.parquet'
+
+        stat = file_path.stat()
+        source_metadata = {
+            'source_size': str(stat.st_size),
+            'source_mtime_ns': str(stat.st_mtime_ns),
+        }
+
+        if parquet_file.exists():
+            try:
+                metadata = pq.read_schema(parquet_file).metadata or {}
+            except (OSError, pa.ArrowException):
+                metadata = {}
+
+            if all(
+                metadata.get(key.encode()) == value.encode()
+                for key, value in source_metadata.items()
+            ):
+                return cls.from_parquet(parquet_file)
+
+        return cls.from_file(file_path).save_station_list_parquet(
+            file_path.name, parquet_file, _metadata=source_metadata
+        )
+
+    @classmethod
+    def from_parquet(cls, file_path: Path) -> Self:
+        """
+
+        Alternative constructor, initializes the ISD station metadata from a Parquet file
+        that was created with self.save_station_list_parquet.
+
+        Unlike from_file, no text parsing or type conversion is required, as the column
+        types are stored in the Parquet file.
+
+        Args:
+            file_path (Path): Path to Parquet file with station metadata
+
+        Returns:
+            Stations: An instance of Stations initialized with data from the file.
+
+        """
+
+        if not file_path.exists():
+            raise FileNotFoundError(f"The file {file_path} does not exist.")
+
+        meta_data = pd.read_parquet(file_path)
+
+        return cls(meta_data, _copy=False)
 
     @classmethod
-    def from_netcdf(cls, file_path: Path) -> Self:
+    def from_netcdf(cls, file_path: Path, lazy: bool = False) -> Self:
         """
         Alternative constructor, initializes the ISD station metadata and
         ISD Lite station observations from a netCDF file that was created with
@@ -173,11 +542,114 @@ class Stations:
             file_path (Path): Path to a netCDF with station observations. The netCDF
                               file needs to have the same structure as a netCDF file
                               created by self.write_observations2netCDF.
+            lazy (bool, optional): If True, the file is opened but the observation variables
+                                   are not read into memory; they are read from the file
+                                   when accessed. The file stays open for the lifetime of
+                                   self.observations. Defaults to False.
         """
 
         # Read the observations from the netCDF file
 
-        observations = xr.load_dataset(file_path)
+        if lazy:
+            observations = xr.open_dataset(file_path)
+        else:
+            observations = xr.load_dataset(file_path)
+
+        # Add a variable holding the UTC time as datetime objects
+
+        times = pd.to_datetime(observations.coords['time'].values)
+
+        if times.tz is None:
+            times = times.tz_localize('UTC')
+        else:
+            times = times.tz_convert('UTC')
+
+        observations['UTC'] = ('time', times.to_pydatetime())
+
+        # Construct metadata
+
+        metadata = observations[cls.column_names].to_dataframe().reset_index(drop=True)
+
+        return cls(metadata, observations=observations, _copy=False)
+
+    @classmethod
+    def from_netcdf_many(cls, file_paths: list[Path]) -> Self:
+        """
+        Alternative constructor, initializes the ISD station metadata and
+        ISD Lite station observations from several netCDF files that were created with
+        self.write_observations2netcdf for the same stations and consecutive periods,
+        e.g. one file per year. The observations are concatenated along time.
+
+        A variable 'UTC' with the UTC time as datetime objects is added.
+
+        Args:
+            file_paths (list[Path]): Paths to netCDF files with station observations. Each
+                                     netCDF file needs to have the same structure as a netCDF
+                                     file created by self.write_observations2netCDF, and all
+                                     files need to hold the same stations, in the same order.
+        """
+
+        if len(file_paths) == 0:
+            raise ValueError('No netCDF files given.')
+
+        # Read the observations from the netCDF files
+
+        datasets = [xr.load_dataset(file_path) for file_path in file_paths]
+
+        # Order the files by their first time, so that they do not need to be listed in order
+        # and the combined time coordinate is monotonic
+
+        datasets.sort(key=lambda ds: ds.coords['time'].values[0])
+
+        # Concatenate the time-dependent variables along time. Variables without a time
+        # dimension (the station metadata) are taken from the first file, and the stations
+        # must be identical in all files.
+
+        observations = xr.concat(
+            datasets,
+            dim='time',
+            data_vars='minimal',
+            coords='minimal',
+            compat='override',
+            join='exact',
+            combine_attrs='override',
+        )
+
+        # Add a variable holding the UTC time as datetime objects
+
+        times = pd.to_datetime(observations.coords['time'].values)
+
+        if times.tz is None:
+            times = times.tz_localize('UTC')
+        else:
+            times = times.tz_convert('UTC')
+
+        observations['UTC'] = ('time', times.to_pydatetime())
+
+        # Construct metadata
+
+        metadata = observations[cls.column_names].to_dataframe().reset_index(drop=True)
+
+        return cls(metadata, observations=observations, _copy=False)
+
+    @classmethod
+    def from_zarr(cls, store_path: Path) -> Self:
+        """
+        Alternative constructor, initializes the ISD station metadata and
+        ISD Lite station observations from a Zarr store that was created with
+        self.write_observations2zarr. Requires the optional dependency zarr.
+
+        A variable 'UTC' with the UTC time as datetime objects is added.
+
+        Args:
+            store_path (Path): Path to a Zarr store with station observations. The Zarr
+                               store needs to have the same structure as a Zarr store
+                               created by self.write_observations2zarr.
+        """
+
+        # Read the observations from the Zarr store
+
+        observations = xr.open_zarr(store_path, chunks=None).load()
 
         # Add a variable holding the UTC time as datetime objects
 
@@ -194,7 +666,7 @@ class Stations:
 
         metadata = observations[cls.column_names].to_dataframe().reset_index(drop=True)
 
-        return cls(metadata, observations=observations)
+        return cls(metadata, observations=observations, _copy=False)
 
     @classmethod
     def from_dataset(cls, ds: xr.Dataset) -> Self:
@@ -228,17 +700,40 @@ class Stations:
                 read as strings and no NA filtering or type conversion applied.
         """
 
-        # Define widths of column names
+        # Read the whole file as text
+
+        if isinstance(source, (str, Path)):
+            with open(source, encoding='utf-8') as f:
+                text = f.read()
+        else:
+            text = source.read()
+            if isinstance(text, bytes):
+                text = text.decode('utf-8')
+
+        # The station records start after the line with the column titles. Locate it with a
+        # single search of the text instead of assuming a fixed number of header lines.
+
+        title_start = text.find('USAF   WBAN  STATION NAME')
+
+        if title_start < 0:
+            raise ValueError('Column titles of the ISD station list not found.')
+
+        records_start = text.find('\n', title_start) + 1
+
+        lines = pd.Series(text[records_start:].splitlines(), dtype='string')
+        lines = lines[lines.str.strip() != ''].reset_index(drop=True)
+
+        # Cut the fixed-width columns out of all lines at once with vectorized string slicing,
+        # instead of parsing line by line with the Python fixed-width parser of pd.read_fwf
+
         widths = [6, 6, 30, 3, 5, 5, 9, 9, 8, 9, 9]
+        starts = np.cumsum([0] + widths[:-1])
 
-        df = pd.read_fwf(
-            source,
-            widths=widths,
-            skiprows=22,
-            names=cls.column_names[0:11],
-            dtype=str,
-            keep_default_na=False,
-            na_filter=False,
+        df = pd.DataFrame(
+            {
+                name: lines.str.slice(start, start + width).fillna('')
+                for name, start, width in zip(cls.column_names[0:11], starts, widths, strict=True)
+            }
         )
 
         # Clean the data
@@ -264,25 +759,28 @@ class Stations:
 
         """
 
-        # Strip whitespace everywhere
-        meta_data = meta_data.map(lambda x: x.strip() if isinstance(x, str) else x)
+        # Strip whitespace everywhere, one column at a time with vectorized string operations
+        for col in meta_data.columns:
+            meta_data[col] = meta_data[col].str.strip()
 
         # Columns by intended type
         string_cols = ["USAF", "WBAN", "STATION_NAME", "CTRY", "ST", "CALL"]
         numeric_cols = ["LAT", "LON", "ELEV"]
         date_cols = ["BEGIN", "END"]
+        category_cols = ["CTRY", "ST"]
 
         # Strings: turn "" into <NA> and use StringDtype
         for col in string_cols:
             meta_data[col] = meta_data[col].replace("", pd.NA).astype("string")
 
+        # Country and state codes take few distinct values: store them as categoricals,
+        # which saves memory and lets filters compare integer codes instead of strings
+        for col in category_cols:
+            meta_data[col] = meta_data[col].astype("category")
+
         # Numerics: parse and coerce invalid/blank to NaN
         for col in numeric_cols:
-            meta_data[col] = pd.to_numeric(meta_data[col], errors="coerce")
-
-        # Dates: parse and coerce invalid/blank to NaT
-        for col in date_cols:
-            meta_data[col] = pd.to_datetime(meta_data[col], format="%Y%m%d", errors="coerce")
+            meta_data[col] = pd.to_numeric(meta_data[col], errors="coerce").astype("float64")
 
         # Reset index
         meta_data = meta_data.reset_index(drop=True)
@@ -297,9 +795,16 @@ class Stations:
             ~meta_data['STATION_NAME'].str.contains('BOGUS', na=False)
         ].reset_index(drop=True)
 
+        # Dates: parse and coerce invalid/blank to NaT. Parsed after dropping the rows above,
+        # with the repeated date strings parsed once each (cache).
+        for col in date_cols:
+            meta_data[col] = pd.to_datetime(
+                meta_data[col], format="%Y%m%d", errors="coerce", cache=True
+            )
+
         return meta_data
 
-    def save_station_list(self, title_line: str, file_path: Path):
+    def save_station_list(self, title_line: str, file_path: Path) -> Self:
         """
 
         Saves ISD station metadata to a file which has the same structure as the
@@ -311,6 +816,7 @@ class Stations:
             file_path (Path): Path to file with station metadata. Parent directory path will be created if it does not exist.
 
         Returns:
+            Stations: This instance, so that calls can be chained.
 
         """
 
@@ -340,30 +846,131 @@ Notes:
 
         columns_title = 'USAF   WBAN  STATION NAME                  CTRY ST CALL  LAT     LON      ELEV    BEGIN    END'
 
-        with open(file_path, 'w') as f:
-            f.write(title_line + '\n')
-            f.write('\n')
-            f.write(header.lstrip('\n'))
-            f.write('\n')
-            f.write(columns_title + '\n')
-            f.write('\n')
-            for _, row in self.meta_data.iterrows():
-                row_strs = [
-                    f"{str(row['USAF']):<6}",
-                    f"{str(row['WBAN']):>6}",
-                    f"{' ' + str(row['STATION_NAME']):<30}",
-                    f"{str(row['CTRY']):>3}",
-                    f"{str(row['ST']):>5}",
-                    f"{str(row['CALL']):>5}",
-                    f"{float(row['LAT']):+9.3f}",
-                    f"{float(row['LON']):+9.3f}",
-                    f"{float(row['ELEV']):+8.1f}",
-                    f"{row['BEGIN'].strftime('%Y%m%d'):>9}",
-                    f"{row['END'].strftime('%Y%m%d'):>9}",
-                ]
-                f.write("".join(row_strs) + '\n')
+        # Assemble the file content and write it at once
+
+        content = ''.join(
+            [
+                title_line + '\n',
+                '\n',
+                header.lstrip('\n'),
+                '\n',
+                columns_title + '\n',
+                '\n',
+                self._station_list_records(),
+            ]
+        )
+
+        with open(file_path, 'wb') as f:
+            f.write(content.encode('utf-8'))
 
-        return
+        return self
+
+    def _station_list_records(self) -> str:
+        """
+        Internal helper formatting the station metadata as the fixed-width records of the
+        Integrated Surface Database (ISD) Station History file. Each column is formatted at once
+        with vectorized string operations, and missing values are written as blanks.
+        """
+
+        meta_data = self.meta_data
+
+        def text(column: str) -> pd.Series:
+            return meta_data[column].astype('string').fillna('')
+
+        def number(column: str, width: int, precision: int) -> pd.Series:
+            values = meta_data[column].map(f'{{:+{width}.{precision}f}}'.format, na_action='ignore')
+            return values.astype('string').fillna('').str.rjust(width)
+
+        def date(column: str) -> pd.Series:
+            values = pd.to_datetime(meta_data[column]).dt.strftime('%Y%m%d')
+            return values.astype('string').fillna('').str.rjust(9)
+
+        records = (
+            text('USAF').str.ljust(6)
+            + text('WBAN').str.rjust(6)
+            + (' ' + text('STATION_NAME')).str.ljust(30)
+            + text('CTRY').str.rjust(3)
+            + text('ST').str.rjust(5)
+            + text('CALL').str.rjust(5)
+            + number('LAT', 9, 3)
+            + number('LON', 9, 3)
+            + number('ELEV', 8, 1)
+            + date('BEGIN')
+            + date('END')
+            + '\n'
+        )
+
+        return ''.join(records.tolist())
+
+    def save_station_list_parquet(
+        self, title_line: str, file_path: Path, _metadata: dict[str, str] = None
+    ) -> Self:
+        """
+
+        Saves ISD station metadata to a zstd-compressed Parquet file, which can be read
+        with Stations.from_parquet considerably faster than the text file written by
+        save_station_list can be read with Stations.from_file.
+
+        Args:
+            title_line (str): Description of the stations in the file, stored as 'title'
+                              in the Parquet key-value metadata, e.g., "Stations in Texas between 2002-2012 for which data are available for download"
+            file_path (Path): Path to Parquet file with station metadata. Parent directory path will be created if it does not exist.
+
+        Returns:
+            Stations: This instance, so that calls can be chained.
+
+        """
+
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        table = pa.Table.from_pandas(self.meta_data, preserve_index=False)
+
+        # Keep the pandas metadata written by pyarrow, and add the title
+
+        metadata = dict(table.schema.metadata or {})
+        metadata[b'title'] = title_line.encode('utf-8')
+        metadata[b'source'] = ncei.isd_lite_stations_url.encode('utf-8')
+
+        for key, value in (_metadata or {}).items():
+            metadata[key.encode('utf-8')] = value.encode('utf-8')
+
+        table = table.replace_schema_metadata(metadata)
+
+        # Write under a temporary name unique to this process and thread and rename when
+        # complete, so that a concurrent reader never sees a partially written file
+
+        part_file_path = file_path.with_name(
+            f'{file_path.name}.{os.getpid()}.{threading.get_ident()}.part'
+        )
+
+        try:
+            pq.write_table(table, part_file_path, compression='zstd')
+            os.replace(part_file_path, file_path)
+        except BaseException:
+            part_file_path.unlink(missing_ok=True)
+            raise
+
+        return self
+
+    def countries(self) -> list[str]:
+        """
+        Returns the sorted two-letter country codes of the ISD stations.
+
+        Returns:
+            list[str]: Sorted two-letter country codes (FIPS country IDs).
+        """
+
+        return sorted(self._country_rows)
+
+    def us_states(self) -> list[str]:
+        """
+        Returns the sorted two-letter US state codes of the ISD stations.
+
+        Returns:
+            list[str]: Sorted two-letter US state codes.
+        """
+
+        return sorted(self._us_state_rows)
 
     def print_countries(self):
         """
@@ -374,8 +981,10 @@ Notes:
         print('Two-letter country codes of the ISD stations')
         print()
 
-        for ii in range(0, len(self.countries()), 10):
-            print(' '.join(self.countries()[ii : ii + 10]))
+        countries = self.countries()
+
+        for ii in range(0, len(countries), 10):
+            print(' '.join(countries[ii : ii + 10]))
 
         return
 
@@ -388,8 +997,10 @@ Notes:
         print('Two-letter US states codes of the ISD stations')
         print()
 
-        for ii in range(0, len(self.us_states()), 10):
-            print(' '.join(self.us_states()[ii : ii + 10]))
+        us_states = self.us_states()
+
+        for ii in range(0, len(us_states), 10):
+            print(' '.join(us_states[ii : ii + 10]))
 
         return
 
@@ -414,18 +1025,107 @@ Notes:
 
         # Filter by latitude and longitude
 
-        meta_data = self.meta_data[
-            (self.meta_data['LAT'] >= min_lat)
-            & (self.meta_data['LAT'] <= max_lat)
-            & (self.meta_data['LON'] >= min_lon)
-            & (self.meta_data['LON'] <= max_lon)
-        ]
+        return self._select_rows(self._rows_in_box(min_lat, max_lat, min_lon, max_lon))
 
-        # Reset row index
+    def filter_by_country(self, country_codes: list[str]) -> Self:
+        '''
 
-        meta_data = meta_data.reset_index(drop=True)
+        Filter by country.
+
+        Args:
+            country_codes (list[str]): Two-letter country codes (FIPS country IDs, as in the
+                                       Integrated Surface Database (ISD) Station History file).
+
+        Returns:
+            Stations:
+                New instance containing only stations in the given countries.
+
+        '''
+
+        return self._select_rows(self._rows_with_codes(self._country_rows, country_codes))
+
+    def filter_by_us_state(self, us_state_codes: list[str]) -> Self:
+        '''
+
+        Filter by US state.
+
+        Args:
+            us_state_codes (list[str]): Two-letter US state codes.
+
+        Returns:
+            Stations:
+                New instance containing only stations in the given US states.
+
+        '''
+
+        return self._select_rows(self._rows_with_codes(self._us_state_rows, us_state_codes))
+
+    def filter_by_period(self, start_time: datetime, end_time: datetime) -> Self:
+        '''
+
+        Filter by period of record.
+
+        Args:
+            start_time (datetime): Start time of the period
+            end_time (datetime): End time of the period
+
+        Returns:
+            Stations:
+                New instance containing only stations whose period of record (BEGIN to END)
+                overlaps with the period given by the start and end time.
+
+        '''
+
+        return self._select_rows(self._rows_in_period(start_time, end_time))
+
+    def filter(
+        self,
+        country_codes: list[str] = None,
+        us_state_codes: list[str] = None,
+        coordinates: tuple[float, float, float, float] = None,
+        period: tuple[datetime, datetime] = None,
+    ) -> Self:
+        '''
+
+        Combined filter by country, US state, latitude/longitude bounds, and period of record.
+        The selections are combined into one mask, and the station metadata is copied only once,
+        which is faster than chaining filter_by_country, filter_by_us_state,
+        filter_by_coordinates, and filter_by_period.
+
+        Args:
+            country_codes (list[str], optional): Two-letter country codes (FIPS country IDs, as in the
+                                                 Integrated Surface Database (ISD) Station History file).
+            us_state_codes (list[str], optional): Two-letter US state codes.
+            coordinates (tuple[float, float, float, float], optional): Inclusive bounds
+                                                 (min_lat, max_lat, min_lon, max_lon) in degrees north/east.
+            period (tuple[datetime, datetime], optional): Start and end time of a period that the
+                                                 period of record of a station must overlap with.
+
+        Returns:
+            Stations:
+                New instance containing only stations that pass all given selections.
+                Selections that are None are not applied.
+
+        '''
 
-        return Stations(meta_data)
+        mask = np.ones(len(self.meta_data), dtype=bool)
+
+        for rows in [
+            None
+            if country_codes is None
+            else self._rows_with_codes(self._country_rows, country_codes),
+            None
+            if us_state_codes is None
+            else self._rows_with_codes(self._us_state_rows, us_state_codes),
+            None if coordinates is None else self._rows_in_box(*coordinates),
+            None if period is None else self._rows_in_period(*period),
+        ]:
+            if rows is not None:
+                selected = np.zeros_like(mask)
+                selected[rows] = True
+                mask &= selected
+
+        return self._select_rows(np.flatnonzero(mask))
 
     def filter_by_region(self, region_gdf: gpd.GeoDataFrame) -> Self:
         '''
@@ -448,33 +1148,33 @@ Notes:
         if region_gdf.crs != 'EPSG:4326':
             region_gdf = region_gdf.to_crs('EPSG:4326')
 
-        # Create GeoDataFrame from self.meta_data with the WGS84 (latitude/longitude)
-        # coordinate reference system (CRS)
-        meta_data_gdf = gpd.GeoDataFrame(
-            self.meta_data,
-            geometry=[
-                Point(lon, lat)
-                for lon, lat in zip(self.meta_data['LON'], self.meta_data['LAT'], strict=False)
-            ],
-            crs='EPSG:4326',
-        )
+        # Filter stations that fall within the union of the geometries, using the spatial index
+        # of the station coordinates to restrict the exact point-in-polygon tests to stations
+        # within the bounding boxes of the geometries.
+        #
+        # A station within any of the geometries lies within their union, and a station that
+        # intersects none of them does not. Only stations on the boundary of a geometry need to
+        # be tested against the union, which is expensive to compute for detailed geometries,
+        # e.g. the CONUS states, and is therefore computed only if there are such stations.
 
-        # Combine geometries in region_gdf into a single multipolygon
-        area = region_gdf.unary_union
+        geometries = region_gdf.geometry.values
 
-        # Filter stations that fall within area
-        filtered_meta_data_gdf = meta_data_gdf[meta_data_gdf.geometry.within(area)]
+        _, rows = self._sindex.query(geometries, predicate='contains')
+        _, boundary_rows = self._sindex.query(geometries, predicate='intersects')
 
-        # Construct a plain pandas DataFrame by dropping the geometry column
-        meta_data = pd.DataFrame(filtered_meta_data_gdf.drop(columns='geometry'))
+        boundary_rows = np.setdiff1d(boundary_rows, rows)
 
-        # Reset row index
-        meta_data = meta_data.reset_index(drop=True)
+        if boundary_rows.size > 0:
+            area = region_gdf.union_all()
+            boundary_points = self._sindex.geometries.take(boundary_rows)
+            boundary_rows = boundary_rows[shapely.contains(area, boundary_points)]
 
-        return Stations(meta_data)
+        rows = np.union1d(rows, boundary_rows)
+
+        return self._select_rows(rows)
 
     def filter_by_data_availability_online(
-        self, start_time: datetime, end_time: datetime, verbose: bool = False
+        self, start_time: datetime, end_time: datetime, verbose: bool = False, n_jobs: int = 1
     ) -> Self:
         """
 
@@ -488,6 +1188,7 @@ Notes:
             start_time (datetime): Start time of period for which files with observations must be available for download
             end_time (datetime): End time of period for which files with observations must be available for download
             verbose (bool): If True, print information. Defaults to False.
+            n_jobs (int): Maximum number of NCEI server directories listed in parallel. Defaults to 1.
 
         Returns:
             Stations: An instance of Stations holding the ISD station metadata for the stations
@@ -496,9 +1197,10 @@ Notes:
 
         """
 
-        # Get the URLs of all ISD Lite data files on the NCEI web server:
+        # Get the URLs of all ISD Lite data files on the NCEI web server, as a set for
+        # constant-time lookup of the tens of thousands of files per year:
 
-        all_file_urls = ncei.isd_lite_data_urls(start_time.year, end_time.year)
+        all_file_urls = set(ncei.isd_lite_data_urls(start_time.year, end_time.year, n_jobs=n_jobs))
 
         #
         # Construct a new dataframe
@@ -514,43 +1216,49 @@ Notes:
             )
             print()
 
-        filtered_rows = []
+        # Construct the URLs of the files of all stations, one year at a time, and look them up
+        # in the set of URLs online. Set lookups are much faster here than Series.isin on the
+        # string columns.
 
-        unavailable_urls = []
+        years = range(start_time.year, end_time.year + 1)
 
-        for _, row in self.meta_data.iterrows():
-            observations_files_available = True
+        ids = self.ids()
 
-            for year in range(start_time.year, end_time.year + 1):
-                url = ncei.isd_lite_data_url(year, row['USAF'], row['WBAN'])
-                if url not in all_file_urls:
-                    observations_files_available = False
-                    unavailable_urls.append(url)
+        available = np.column_stack(
+            [
+                np.fromiter(
+                    (
+                        ncei.isd_lite_data_url(year, usaf_id, wban_id) in all_file_urls
+                        for usaf_id, wban_id in ids
+                    ),
+                    dtype=bool,
+                    count=len(ids),
+                )
+                for year in years
+            ]
+        )
 
-            if observations_files_available:
-                filtered_rows.append(row)
-                if verbose:
-                    print('Including station', row['USAF'], row['WBAN'], row['STATION_NAME'])
-            else:
-                if verbose:
+        rows = np.flatnonzero(available.all(axis=1))
+
+        if verbose:
+            station_names = self.meta_data['STATION_NAME'].tolist()
+            for ii, (usaf_id, wban_id) in enumerate(ids):
+                if available[ii].all():
+                    print('Including station', usaf_id, wban_id, station_names[ii])
+                else:
                     print(
                         'Excluding station',
-                        row['USAF'],
-                        row['WBAN'],
-                        row['STATION_NAME'],
+                        usaf_id,
+                        wban_id,
+                        station_names[ii],
                         '(not all files with observations for the time range are available for download)',
                     )
-                    for url in unavailable_urls:
-                        print('Unavailable: ', url)
+                    for jj in np.flatnonzero(~available[ii]):
+                        print('Unavailable: ', ncei.isd_lite_data_url(years[jj], usaf_id, wban_id))
 
-        # Construct a new DataFrame from the selected rows
-        meta_data = pd.DataFrame(filtered_rows, columns=self.meta_data.columns)
+        # Select the rows at once, which keeps the column types of the station metadata
 
-        # Reset row index
-
-        meta_data = meta_data.reset_index(drop=True)
-
-        return Stations(meta_data)
+        return self._select_rows(rows)
 
     def filter_by_data_availability_offline(
         self, data_dir: Path, start_time: datetime, end_time: datetime, verbose: bool = False
@@ -591,43 +1299,48 @@ Notes:
             )
             print()
 
-        filtered_rows = []
+        # Iterate over the station IDs and names only, and collect the row positions of the
+        # selected stations, instead of copying each row into a Series
+
+        rows = []
 
-        unavailable_files = []
+        station_ids = zip(
+            self.meta_data['USAF'].tolist(),
+            self.meta_data['WBAN'].tolist(),
+            self.meta_data['STATION_NAME'].tolist(),
+            strict=True,
+        )
 
-        for _, row in self.meta_data.iterrows():
+        for ii, (usaf_id, wban_id, station_name) in enumerate(station_ids):
             observations_files_available = True
 
+            unavailable_files = []
+
             for year in range(start_time.year, end_time.year + 1):
-                file_path = data_dir / ncei.isd_lite_data_file_name(year, row['USAF'], row['WBAN'])
+                file_path = data_dir / ncei.isd_lite_data_file_name(year, usaf_id, wban_id)
                 if not file_path.exists():
                     observations_files_available = False
                     unavailable_files.append(file_path)
 
             if observations_files_available:
-                filtered_rows.append(row)
+                rows.append(ii)
                 if verbose:
-                    print('Including station', row['USAF'], row['WBAN'], row['STATION_NAME'])
+                    print('Including station', usaf_id, wban_id, station_name)
             else:
                 if verbose:
                     print(
                         'Excluding station',
-                        row['USAF'],
-                        row['WBAN'],
-                        row['STATION_NAME'],
+                        usaf_id,
+                        wban_id,
+                        station_name,
                         '(not all files with observations in the requested time range are available locally)',
                     )
                     for file_path in unavailable_files:
                         print('Unavailable: ', file_path)
 
-        # Construct a new DataFrame from the selected rows
-        meta_data = pd.DataFrame(filtered_rows, columns=self.meta_data.columns)
-
-        # Reset row index
-
-        meta_data = meta_data.reset_index(drop=True)
+        # Select the rows at once, which keeps the column types of the station metadata
 
-        return Stations(meta_data)
+        return self._select_rows(np.array(rows, dtype=np.intp))
 
     def filter_by_id(self, usaf_id: str, wban_id: str) -> Self:
         '''
@@ -644,7 +1357,13 @@ Notes:
 
         '''
 
-        if [usaf_id, wban_id] not in self.ids():
+        # Vectorized comparison of the ID columns, without building the list of all station IDs
+
+        mask = (self.meta_data['USAF'].eq(usaf_id) & self.meta_data['WBAN'].eq(wban_id)).to_numpy(
+            dtype=bool, na_value=False
+        )
+
+        if not mask.any():
             raise ValueError(
                 usaf_id
                 + ' '
@@ -655,38 +1374,48 @@ Notes:
 
         # Filter by station IDs
 
-        meta_data = self.meta_data[
-            (self.meta_data['USAF'] == usaf_id) & (self.meta_data['WBAN'] == wban_id)
-        ]
+        meta_data = self.meta_data[mask]
 
         # Reset row index
 
         meta_data = meta_data.reset_index(drop=True)
 
-        return Stations(meta_data)
+        return Stations(meta_data, _copy=False)
 
-    def ids(self) -> list[list[str]]:
+    def ids(self, return_as: str = 'list') -> list[list[str]] | np.ndarray | pa.Table:
         """
 
-        Returns a list of 2-element lists containing station USAF and WBAN IDs as strings.
+        Returns the station USAF and WBAN IDs as strings.
+
+        Args:
+            return_as (str, optional): Type of the returned IDs. One of
+                                       'list': A list of 2-element lists,
+                                       'numpy': A NumPy array with 2 columns, which avoids building a list
+                                                for each station,
+                                       'arrow': A PyArrow table with the columns 'USAF' and 'WBAN'.
+                                       Defaults to 'list'.
 
         Returns:
-            list[list[str]]: A list of 2-element lists. Each inner list contains:
+            list[list[str]] | np.ndarray | pa.Table: The station IDs, one station per row or inner list:
                              - First element : USAF = Air Force station ID. May contain a letter in the first position.  (str)
                              - Second element: WBAN = NCDC WBAN number (str)
 
         """
 
-        # Selects all rows and the first two columns in the dataframe
-        subset = self.meta_data.iloc[:, 0:2]
-
-        # Convert to nested list
-        result = subset.values.tolist()
+        id_columns = self.meta_data[['USAF', 'WBAN']]
 
-        return result
+        if return_as == 'list':
+            # Convert the ID columns to a nested list in one step
+            return id_columns.to_numpy().tolist()
+        elif return_as == 'numpy':
+            return id_columns.to_numpy()
+        elif return_as == 'arrow':
+            return pa.Table.from_pandas(id_columns, preserve_index=False)
+        else:
+            raise ValueError(f"return_as must be 'list', 'numpy', or 'arrow', not {return_as!r}.")
 
     def load_observations(
-        self, data_dir: Path, start_year: int, end_year: int, verbose: bool = False
+        self, data_dir: Path, start_year: int, end_year: int, verbose: bool = False, n_jobs: int = 1
     ):
         """
         Loads ISD Lite station observations for a given year range (inclusive)
@@ -702,8 +1431,14 @@ Notes:
             start_year (int): Gregorian year of the first data file to be read
             end_year (int): Gregorian year of the last data file to be read
             verbose (bool): If True, print information. Defaults to False.
+            n_jobs (int): Maximum number of stations whose files are read in parallel threads.
+                          File I/O and decompression release the GIL, so threads speed up
+                          reading. Defaults to 1.
         """
 
+        if n_jobs is None:
+            n_jobs = 1
+
         #
         # Load data for each station and the year range
         #
@@ -723,26 +1458,44 @@ Notes:
         begins = []
         ends = []
 
-        for row in self.meta_data.itertuples():
-            if verbose:
-                print('Loading observations for station', row.STATION_NAME)
+        rows = list(self.meta_data.itertuples())
+
+        # Share the CPUs between the parallel threads, so that files decompressed in parallel
+        # in each of them do not start n_jobs times as many decompression threads as CPUs
 
-            df = self.read_station_observations(data_dir, start_year, end_year, row.USAF, row.WBAN)
+        n_decompression_threads = max(1, (os.cpu_count() or 1) // n_jobs)
 
-            dfs.append(df)
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            station_dfs = executor.map(
+                lambda row: self.read_station_observations(
+                    data_dir,
+                    start_year,
+                    end_year,
+                    row.USAF,
+                    row.WBAN,
+                    _n_decompression_threads=n_decompression_threads,
+                ),
+                rows,
+            )
 
-            usaf_ids.append(row.USAF)
-            wban_ids.append(row.WBAN)
-            station_ids.append(row.STATION_ID)
-            station_names.append(row.STATION_NAME)
-            calls.append(row.CALL)
-            ctrys.append(row.CTRY)
-            ussts.append(row.ST)
-            lats.append(row.LAT)
-            lons.append(row.LON)
-            elevs.append(row.ELEV)
-            begins.append(row.BEGIN)
-            ends.append(row.END)
+            for row, df in zip(rows, station_dfs, strict=True):
+                if verbose:
+                    print('Loaded observations for station', row.STATION_NAME)
+
+                dfs.append(df)
+
+                usaf_ids.append(row.USAF)
+                wban_ids.append(row.WBAN)
+                station_ids.append(row.STATION_ID)
+                station_names.append(row.STATION_NAME)
+                calls.append(row.CALL)
+                ctrys.append(row.CTRY)
+                ussts.append(row.ST)
+                lats.append(row.LAT)
+                lons.append(row.LON)
+                elevs.append(row.ELEV)
+                begins.append(row.BEGIN)
+                ends.append(row.END)
 
         assert len(dfs) > 0, 'Not enough data. Aborting.'
 
@@ -770,33 +1523,27 @@ Notes:
         # Create common times
         #
 
-        # Union of all time values
-
-        all_times = pd.Index([])
-        for df in dfs:
-            all_times = all_times.union(df.index)
+        # Union of all time values, sorted
 
-        all_times = all_times.sort_values()
-
-        # Convert to numpy array of dtype datetime64[ns]
-        all_times = pd.to_datetime(all_times).values
+        all_times = np.unique(np.concatenate([df.index.to_numpy() for df in dfs]))
 
         #
         # Construct a dictionary, which for each variable, holds
         # a numpy array with the data as a function of time and station
         #
 
-        # Collect all columns containing variables (that means exclude time)
-        columns = [col for col in dfs[0].columns if col != 'time']
+        # Position of each time of each station in the common times, computed once per station
+        # and shared by all variables
+
+        time_indices = [np.searchsorted(all_times, df.index.to_numpy()) for df in dfs]
 
         data_vars = {}
-        for var in columns:
-            # Numpy array with the dimensions all times, stations
-            arr = np.full((len(all_times), len(dfs)), np.nan)
-            for i, df in enumerate(dfs):
-                times = df.index
-                s = pd.Series(df[var].values, index=times)
-                arr[:, i] = s.reindex(all_times).values
+        for var in self.var_names:
+            # Numpy array with the dimensions all times, stations, preallocated and filled
+            # in place station by station
+            arr = np.full((len(all_times), len(dfs)), np.nan, dtype=np.float32)
+            for i, (df, time_index) in enumerate(zip(dfs, time_indices, strict=True)):
+                arr[time_index, i] = df[var].to_numpy()
             data_vars[var] = (('time', 'station'), arr)
 
         #
@@ -880,6 +1627,11 @@ Notes:
         """
         Writes the xarray self.observations into a netCDF file.
 
+        The observations are stored compressed, in chunks holding the full time series
+        of one station, so that reading the time series of individual stations is fast.
+        They are packed into 16 bit integers with the scale factors of the ISD Lite data
+        files, which preserves their precision as read from these files.
+
         Args:
             file_path (Path): Path to the netCDF file. The file will be overwritten if it exists.
         """
@@ -907,6 +1659,29 @@ Notes:
             },
         }
 
+        # Chunk the observations such that the full time series of a station is stored
+        # contiguously on disk, matching the typical access pattern (one station, all times),
+        # and compress them. zstd is used when the netCDF library supports it, zlib otherwise.
+
+        if netCDF4.__has_zstandard_support__:
+            compression = {"compression": "zstd", "complevel": 3}
+        else:
+            compression = {"zlib": True, "complevel": 3}
+
+        n_times = self.observations.sizes['time']
+
+        for var, scale_factor in zip(self.var_names, self.var_scale_factors, strict=True):
+            if self.observations[var].dims == ('time', 'station'):
+                encoding[var].update({"chunksizes": (n_times, 1), **compression})
+
+                # Pack the observations into 16 bit integers, as in the ISD Lite data files,
+                # with missing values stored as in these files
+
+                encoding[var].update({"dtype": "int16", "_FillValue": -9999})
+
+                if scale_factor != 1:
+                    encoding[var]["scale_factor"] = np.float32(scale_factor)
+
         # Identify any variables in the xarray that hold objects (such as datatime objects)
         object_vars = [
             name for name, var in self.observations.data_vars.items() if var.dtype == object
@@ -924,6 +1699,61 @@ Notes:
 
         return
 
+    def write_observations2zarr(self, store_path: Path):
+        """
+        Writes the xarray self.observations into a Zarr store. Requires the optional
+        dependency zarr.
+
+        The observations are stored compressed, in chunks of one year and 64 stations
+        (about 2 MB per chunk uncompressed), which allows for parallel, chunk-wise access
+        to subsets of the stations and times.
+
+        Args:
+            store_path (Path): Path to the Zarr store. The store will be overwritten if it exists.
+        """
+
+        # Build encoding
+
+        encoding = {
+            "time": {
+                "dtype": "float64",
+                "units": "seconds since 1970-01-01T00:00:00Z",
+                "calendar": "proleptic_gregorian",
+            },
+            **{
+                var: {"dtype": "float32"}
+                for var in self.observations.data_vars
+                if np.issubdtype(self.observations[var].dtype, np.floating)
+            },
+        }
+
+        chunks = (
+            min(self.observations.sizes['time'], 8760),
+            min(self.observations.sizes['station'], 64),
+        )
+
+        for var in self.var_names:
+            if self.observations[var].dims == ('time', 'station'):
+                encoding[var]["chunks"] = chunks
+
+        # Identify any variables in the xarray that hold objects (such as datatime objects)
+        object_vars = [
+            name for name, var in self.observations.data_vars.items() if var.dtype == object
+        ]
+
+        # Save to Zarr skipping any variables that are objects
+        # The Zarr format version 2 is used because its specification covers the fixed-length
+        # string variables holding the station metadata, and it is readable by more tools.
+        self.observations.drop_vars(object_vars).to_zarr(
+            store_path, mode='w', encoding=encoding, zarr_format=2
+        )
+
+        print()
+        print('Saved the full-hourly UTC time series Zarr store', store_path)
+        print()
+
+        return
+
     def read_station_observations(
         self,
         data_dir: Path,
@@ -932,6 +1762,7 @@ Notes:
         usaf_id: str,
         wban_id: str,
         missing_value=-9999,
+        _n_decompression_threads: int = None,
     ) -> pd.DataFrame:
         """
         Reads ISD Lite observations from (gzipped) NCEI ISD Lite data files
@@ -956,7 +1787,7 @@ Notes:
                                as a function of time for the given station and the given year range.
         """
 
-        dfs = []
+        data = []
 
         for year in range(start_year, end_year + 1):
             file_path = data_dir / ncei.isd_lite_data_file_name(year, usaf_id, wban_id)
@@ -964,59 +1795,52 @@ Notes:
             if not file_path.exists():
                 raise ValueError(str(file_path) + ' does not exist.')
 
-            # Read the gzipped file as text
-
-            with gzip.open(file_path, 'rt') as f:
-                # Read all lines, split by whitespace
-                df = pd.read_csv(
-                    f,
-                    sep=r'\s+',
-                    header=None,
-                    na_values=missing_value,
-                    dtype={
-                        0: int,
-                        1: int,
-                        2: int,
-                        3: int,
-                        4: np.float32,
-                        5: np.float32,
-                        6: np.float32,
-                        7: np.float32,
-                        8: np.float32,
-                        9: np.float32,
-                        10: np.float32,
-                        11: np.float32,
-                    },
-                )
+            # Read the gzipped file, which contains only whitespace-separated integers,
+            # with NumPy's compiled text parser into an integer array with 12 columns. All
+            # values, including the scaled observations, fit into 16 bit integers.
 
-            # Remove trace precipitation values
+            with _open_gz_text(file_path, _n_decompression_threads) as f:
+                data.append(np.loadtxt(f, dtype=np.int16, ndmin=2).reshape(-1, 12))
 
-            for jj in range(10, 12):
-                col = df.iloc[:, jj]
-                mask = col == -1
-                df.iloc[mask, jj] = 0
+        data = np.concatenate(data)
 
-            # Multiply colums with appropriate scaling factors
+        # Observations, one array per variable
 
-            cols = [4, 5, 6, 8, 10, 11]
-            df.iloc[:, cols] = 0.1 * df.iloc[:, cols]
+        observations = {}
 
-            # Extract the time columns and convert them to datetime objects
-            df['time'] = pd.to_datetime(
-                df.iloc[:, 0:4].astype(str).agg(' '.join, axis=1), format='%Y %m %d %H'
-            )
+        for jj, (var_name, scale_factor) in enumerate(
+            zip(self.var_names, self.var_scale_factors, strict=True)
+        ):
+            values = data[:, 4 + jj]
+
+            observation = values.astype(np.float64)
+
+            # Missing values
+
+            observation[values == missing_value] = np.nan
+
+            # Remove trace precipitation values
+
+            if var_name in ['PREC1H', 'PREC6H']:
+                observation[values == -1] = 0
+
+            # Multiply with appropriate scaling factor
 
-            # Cut the time columns
-            df = df.drop(columns=[0, 1, 2, 3])
+            if scale_factor != 1:
+                observation = scale_factor * observation
 
-            dfs.append(df)
+            observations[var_name] = observation.astype(np.float32)
 
-        df_merged = pd.concat(dfs, ignore_index=True)
+        # Convert the time columns to datetime objects
+
+        times = pd.to_datetime(
+            pd.DataFrame(
+                {'year': data[:, 0], 'month': data[:, 1], 'day': data[:, 2], 'hour': data[:, 3]}
+            )
+        )
 
-        # Set variable names
-        df_merged.columns = self.var_names + ['time']
+        # Construct dataframe with variable names and time as index
 
-        # Set time as index
-        df_merged = df_merged.set_index('time')
+        df_merged = pd.DataFrame(observations, index=pd.DatetimeIndex(times, name='time'))
 
         return df_merged
@@ -0,0 +1,193 @@
+import hashlib
+import threading
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+import urllib3
+
+from isd_lite_data import ncei
+
+# Modification time of the files served by the test server
+last_modified_time = 1700000000
+
+
+class FileServer:
+    """
+    Local HTTP server serving files from memory, with ETag or Last-Modified validation,
+    and optionally truncated response bodies.
+    """
+
+    def __init__(self):
+        self.files = {}
+        self.send_etag = True
+        self.n_truncated = 0
+        self.requests = []
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                server.requests.append(self.path)
+
+                if self.path not in server.files:
+                    self.send_response(404)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+
+                body = server.files[self.path]
+                etag = '"' + hashlib.md5(body).hexdigest() + '"'
+
+                if_none_match = self.headers.get('If-None-Match')
+                if_modified_since = self.headers.get('If-Modified-Since')
+
+                if (server.send_etag and if_none_match == etag) or (
+                    not server.send_etag
+                    and if_modified_since is not None
+                    and parsedate_to_datetime(if_modified_since).timestamp() >= last_modified_time
+                ):
+                    self.send_response(304)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+
+                self.send_response(200)
+                self.send_header('Content-Length', str(len(body)))
+                if server.send_etag:
+                    self.send_header('ETag', etag)
+                self.send_header('Last-Modified', formatdate(last_modified_time, usegmt=True))
+                self.end_headers()
+
+                # Send only part of the body and drop the connection
+
+                if server.n_truncated > 0:
+                    server.n_truncated -= 1
+                    self.wfile.write(body[: len(body) // 2])
+                    self.wfile.flush()
+                    self.close_connection = True
+                    return
+
+                self.wfile.write(body)
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f'http://127.0.0.1:{self.httpd.server_port}'
+
+
+@pytest.fixture
+def file_server(monkeypatch):
+    # Retry without waiting
+    monkeypatch.setattr(ncei.time, 'sleep', lambda seconds: None)
+
+    server = FileServer()
+    thread = threading.Thread(
+        target=server.httpd.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True
+    )
+    thread.start()
+    yield server
+    server.httpd.shutdown()
+    server.httpd.server_close()
+
+
+def test_download_file_etag(file_server, tmp_path):
+    file_server.files['/a.gz'] = b'a' * 1000
+    local_file = tmp_path / 'a.gz'
+
+    ncei.download_file(file_server.url + '/a.gz', local_file)
+
+    assert local_file.read_bytes() == b'a' * 1000
+    assert (tmp_path / 'a.gz.etag').exists()
+    assert not (tmp_path / 'a.gz.part').exists()
+
+    # Unchanged online: 304, and the local file is kept
+
+    mtime_ns = local_file.stat().st_mtime_ns
+    ncei.download_file(file_server.url + '/a.gz', local_file)
+    assert local_file.stat().st_mtime_ns == mtime_ns
+    assert len(file_server.requests) == 2
+
+    # Changed online: downloaded again
+
+    file_server.files['/a.gz'] = b'b' * 1000
+    ncei.download_file(file_server.url + '/a.gz', local_file)
+    assert local_file.read_bytes() == b'b' * 1000
+
+
+def test_download_file_refresh(file_server, tmp_path):
+    file_server.files['/a.gz'] = b'a' * 1000
+    local_file = tmp_path / 'a.gz'
+
+    ncei.download_file(file_server.url + '/a.gz', local_file)
+    local_file.write_bytes(b'local')
+    ncei.download_file(file_server.url + '/a.gz', local_file, refresh=True)
+
+    assert local_file.read_bytes() == b'a' * 1000
+
+
+def test_download_file_last_modified(file_server, tmp_path):
+    file_server.send_etag = False
+    file_server.files['/a.gz'] = b'a' * 1000
+    local_file = tmp_path / 'a.gz'
+
+    ncei.download_file(file_server.url + '/a.gz', local_file)
+
+    assert (tmp_path / 'a.gz.last-modified').exists()
+    assert not (tmp_path / 'a.gz.etag').exists()
+
+    # Unchanged online: 304, and the local file is kept
+
+    local_file.write_bytes(b'local')
+    ncei.download_file(file_server.url + '/a.gz', local_file)
+    assert local_file.read_bytes() == b'local'
+
+
+def test_download_file_retries_truncated_body(file_server, tmp_path):
+    file_server.files['/a.gz'] = b'a' * 100000
+    file_server.n_truncated = 1
+    local_file = tmp_path / 'a.gz'
+
+    ncei.download_file(file_server.url + '/a.gz', local_file)
+
+    assert local_file.read_bytes() == b'a' * 100000
+    assert len(file_server.requests) == 2
+
+
+def test_download_file_failure_keeps_local_file(file_server, tmp_path):
+    file_server.files['/a.gz'] = b'a' * 100000
+    file_server.n_truncated = 2
+    local_file = tmp_path / 'a.gz'
+    local_file.write_bytes(b'local')
+
+    with pytest.raises((requests.exceptions.RequestException, urllib3.exceptions.HTTPError)):
+        ncei.download_file(file_server.url + '/a.gz', local_file, refresh=True, max_retries=2)
+
+    # The interrupted downloads leave neither a truncated file nor a temporary file
+
+    assert local_file.read_bytes() == b'local'
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['a.gz']
+
+
+def test_download_iter(file_server, tmp_path):
+    names = [f'{ii}.gz' for ii in range(5)]
+    for name in names:
+        file_server.files['/' + name] = name.encode() * 100
+
+    urls = [file_server.url + '/' + name for name in names]
+    paths = [tmp_path / name for name in names]
+
+    downloaded = list(ncei.download_iter(urls, paths, n_jobs=3))
+
+    assert sorted(downloaded) == sorted(paths)
+    for path in paths:
+        assert path.read_bytes() == path.name.encode() * 100
+
+
+def test_download_iter_argument_mismatch(tmp_path):
+    with pytest.raises(ValueError):
+        ncei.download_iter(['http://127.0.0.1/a.gz'], [])
@@ -0,0 +1,114 @@
+import gzip
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from isd_lite_data import stations
+from isd_lite_data.stations import Stations
+
+# Station records: USAF, WBAN, station name, country, US state, call sign, latitude, longitude,
+# elevation, begin and end of the period of record
+records = [
+    ('720000', '03017', 'DENVER', 'US', 'CO', '', 39.75, -104.87, 1655.1, '19730101', '20251231'),
+    ('724660', '93037', 'PUEBLO', 'US', 'CO', '', 38.29, -104.51, 1439.0, '19450101', '19991231'),
+    ('010010', '99999', 'JAN MAYEN', 'NO', '', '', 70.93, -8.67, 9.0, '20000101', '20000630'),
+    ('999999', '99999', 'BOGUS STATION', 'US', 'TX', '', 30.0, -100.0, 0.0, '20000101', '20001231'),
+]
+
+
+def write_station_list(file_path, records):
+    lines = [
+        'Integrated Surface Database Station History',
+        '',
+        'USAF   WBAN  STATION NAME                  CTRY ST CALL  LAT     LON      ELEV(M) BEGIN    END',
+        '',
+    ]
+    for usaf, wban, name, ctry, st, call, lat, lon, elev, begin, end in records:
+        lines.append(
+            f'{usaf:<6}{wban:>6}{" " + name:<30}{ctry:>3}{st:>5}{call:>5}'
+            f'{lat:+9.3f}{lon:+9.3f}{elev:+8.1f}{begin:>9}{end:>9}'
+        )
+    file_path.write_text('\n'.join(lines) + '\n')
+
+
+@pytest.fixture
+def station_list(tmp_path):
+    file_path = tmp_path / 'isd-history.txt'
+    write_station_list(file_path, records)
+    return file_path
+
+
+def test_from_file(station_list):
+    s = Stations.from_file(station_list)
+
+    # Stations with 'BOGUS' in the name are dropped
+    assert s.ids() == [['720000', '03017'], ['724660', '93037'], ['010010', '99999']]
+    assert s.meta_data['LAT'].tolist() == [39.75, 38.29, 70.93]
+    assert s.meta_data['BEGIN'].iloc[0] == pd.Timestamp('1973-01-01')
+
+
+def test_filter_by_period(station_list):
+    s = Stations.from_file(station_list)
+
+    filtered = s.filter_by_period(datetime(2000, 1, 1), datetime(2000, 12, 31))
+    assert filtered.ids() == [['720000', '03017'], ['010010', '99999']]
+
+    # The period bounds are inclusive
+    filtered = s.filter_by_period(datetime(1999, 12, 31), datetime(1999, 12, 31))
+    assert filtered.ids() == [['720000', '03017'], ['724660', '93037']]
+
+    filtered = s.filter_by_period(datetime(2030, 1, 1), datetime(2030, 12, 31))
+    assert len(filtered.meta_data) == 0
+
+
+def test_parquet_round_trip(station_list, tmp_path):
+    s = Stations.from_file(station_list)
+    parquet_file = tmp_path / 'stations.parquet'
+
+    s.save_station_list_parquet('Test stations', parquet_file)
+    s_parquet = Stations.from_parquet(parquet_file)
+
+    # Compare values, with any missing value representation
+
+    pd.testing.assert_frame_equal(
+        s_parquet.meta_data.astype(object).fillna(''),
+        s.meta_data.astype(object).fillna(''),
+        check_dtype=False,
+    )
+    assert [path.name for path in tmp_path.iterdir() if path.name.endswith('.part')] == []
+
+
+def test_from_cache_or_file(station_list, tmp_path):
+    cache_dir = tmp_path / 'cache'
+
+    s = Stations.from_cache_or_file(station_list, cache_dir)
+    assert len(list(cache_dir.iterdir())) == 1
+
+    s_cached = Stations.from_cache_or_file(station_list, cache_dir)
+    assert s_cached.ids() == s.ids()
+
+    # A changed file is parsed again, and replaces its cached file
+
+    write_station_list(station_list, records[:1])
+    s_changed = Stations.from_cache_or_file(station_list, cache_dir)
+    assert s_changed.ids() == [['720000', '03017']]
+    assert len(list(cache_dir.iterdir())) == 1
+
+
+def test_open_gz_text_rapidgzip(tmp_path, monkeypatch):
+    pytest.importorskip('rapidgzip')
+
+    text = ''.join(f'2021 01 01 {hour:02d}' + '   -10' * 8 + '\n' for hour in range(24)) * 100
+    file_path = tmp_path / 'data.gz'
+    with gzip.open(file_path, 'wt') as f:
+        f.write(text)
+
+    monkeypatch.setattr(stations, 'rapidgzip_min_file_size', 0)
+
+    with stations._open_gz_text(file_path, n_threads=2) as f:
+        data = np.loadtxt(f, dtype=np.int16)
+
+    assert data.shape == (2400, 12)
+    assert (data[:, 4:] == -10).all()